@@ -12,10 +12,31 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .collectors import PriceCollector
-from .analyzers import PriceAnalyzer
-from .visualizers import PriceVisualizer
-from .exporters import DataExporter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .collectors import PriceCollector
+    from .analyzers import PriceAnalyzer
+    from .visualizers import PriceVisualizer
+    from .exporters import DataExporter
+
+# Public classes are imported on first access, so e.g. analysis-only users
+# don't pay for the scraping and plotting stacks at import time
+_LAZY_IMPORTS = {
+    "PriceCollector": ".collectors",
+    "PriceAnalyzer": ".analyzers",
+    "PriceVisualizer": ".visualizers",
+    "DataExporter": ".exporters",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "PriceCollector",
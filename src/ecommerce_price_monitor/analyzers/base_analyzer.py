@@ -60,6 +60,9 @@ class BaseAnalyzer(ABC):
     ) -> AnalysisResult:
         """Perform analysis on the provided data.
         
+        A DataFrame is used as-is rather than copied, so implementations must
+        treat it as read-only and copy before adding or changing columns.
+        
         Args:
             data: Data to analyze (products or DataFrame)
             **kwargs: Additional analysis parameters
@@ -125,8 +128,10 @@ class BaseAnalyzer(ABC):
                     self.logger.warning("Empty product list provided")
                     return False
                 
-                # Check if all items are ProductData instances
-                if not all(isinstance(item, ProductData) for item in data):
+                # Check if all items are ProductData instances; collecting the
+                # distinct types runs in C, so only those few need an issubclass check
+                item_types = set(map(type, data))
+                if not all(issubclass(item_type, ProductData) for item_type in item_types):
                     self.logger.error("Invalid data type in product list")
                     return False
                 
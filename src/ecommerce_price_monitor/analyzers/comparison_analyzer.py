@@ -7,7 +7,11 @@ from collections import defaultdict
 
 from .base_analyzer import BaseAnalyzer, AnalysisResult
 from ..collectors.base_collector import ProductData
-from ..utils.helpers import calculate_percentage_change, normalize_product_name
+from ..utils.helpers import (
+    calculate_percentage_change,
+    calculate_percentage_change_array,
+    normalize_product_name
+)
 
 
 class ComparisonAnalyzer(BaseAnalyzer):
@@ -36,7 +40,7 @@ class ComparisonAnalyzer(BaseAnalyzer):
         if isinstance(data, list):
             df = self.prepare_dataframe(data)
         else:
-            df = data.copy()
+            df = data
         
         similarity_threshold = kwargs.get('similarity_threshold', 0.8)
         include_shipping = kwargs.get('include_shipping', False)
@@ -160,16 +164,22 @@ class ComparisonAnalyzer(BaseAnalyzer):
             # Find most competitive platform (lowest average price)
             most_competitive = min(mean_prices.keys(), key=lambda x: mean_prices[x])
             
-            # Calculate potential savings
-            savings_analysis = {}
-            for platform in mean_prices.keys():
-                if platform != most_competitive:
-                    savings = mean_prices[platform] - mean_prices[most_competitive]
-                    savings_percent = calculate_percentage_change(mean_prices[most_competitive], mean_prices[platform])
-                    savings_analysis[platform] = {
-                        'absolute_savings': float(savings),
-                        'percent_savings': float(savings_percent)
-                    }
+            # Calculate potential savings for all other platforms at once
+            other_platforms = [platform for platform in mean_prices if platform != most_competitive]
+            other_means = np.array([mean_prices[platform] for platform in other_platforms])
+            best_mean = mean_prices[most_competitive]
+            savings = other_means - best_mean
+            savings_percent = calculate_percentage_change_array(
+                np.full_like(other_means, best_mean), other_means
+            )
+            
+            savings_analysis = {
+                platform: {
+                    'absolute_savings': float(saving),
+                    'percent_savings': float(percent)
+                }
+                for platform, saving, percent in zip(other_platforms, savings, savings_percent)
+            }
             
             price_comparison['competitiveness'] = {
                 'most_competitive_platform': most_competitive,
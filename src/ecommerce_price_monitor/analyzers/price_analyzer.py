@@ -45,7 +45,7 @@ class PriceAnalyzer(BaseAnalyzer):
         if isinstance(data, list):
             df = self.prepare_dataframe(data)
         else:
-            df = data.copy()
+            df = data
         
         analysis_results = {}
         
@@ -137,26 +137,33 @@ class PriceAnalyzer(BaseAnalyzer):
         
         platform_stats = {}
         
-        for platform in df['platform'].unique():
-            platform_data = df[df['platform'] == platform]
-            valid_prices = platform_data[platform_data['price'] > 0]['price']
+        # Aggregate every platform in one grouped pass instead of masking the
+        # frame once per platform
+        platforms = df.groupby('platform', sort=False, observed=True)
+        product_counts = platforms.size()
+        price_stats = df.loc[df['price'] > 0].groupby('platform', sort=False, observed=True)['price'].agg(
+            ['count', 'mean', 'median', 'min', 'max', 'std']
+        )
+        rating_stats = platforms['rating'].agg(['count', 'mean']) if 'rating' in df.columns else None
+        
+        for platform, product_count in product_counts.items():
+            if platform not in price_stats.index:
+                continue
             
-            if not valid_prices.empty:
-                platform_stats[platform] = {
-                    'product_count': len(platform_data),
-                    'average_price': float(valid_prices.mean()),
-                    'median_price': float(valid_prices.median()),
-                    'min_price': float(valid_prices.min()),
-                    'max_price': float(valid_prices.max()),
-                    'price_std': float(valid_prices.std()) if len(valid_prices) > 1 else 0
-                }
-                
-                # Calculate rating stats if available
-                if 'rating' in platform_data.columns:
-                    valid_ratings = platform_data.dropna(subset=['rating'])
-                    if not valid_ratings.empty:
-                        platform_stats[platform]['average_rating'] = float(valid_ratings['rating'].mean())
-                        platform_stats[platform]['rating_count'] = len(valid_ratings)
+            prices = price_stats.loc[platform]
+            platform_stats[platform] = {
+                'product_count': int(product_count),
+                'average_price': float(prices['mean']),
+                'median_price': float(prices['median']),
+                'min_price': float(prices['min']),
+                'max_price': float(prices['max']),
+                'price_std': float(prices['std']) if prices['count'] > 1 else 0
+            }
+            
+            # Calculate rating stats if available
+            if rating_stats is not None and rating_stats.at[platform, 'count'] > 0:
+                platform_stats[platform]['average_rating'] = float(rating_stats.at[platform, 'mean'])
+                platform_stats[platform]['rating_count'] = int(rating_stats.at[platform, 'count'])
         
         # Find best and worst platforms by price
         if platform_stats:
@@ -380,9 +387,9 @@ class PriceAnalyzer(BaseAnalyzer):
         if 'price' in df.columns:
             valid_price_df = df[df['price'] > 0]
             if not valid_price_df.empty:
-                cheapest_platform = valid_price_df.groupby('platform')['price'].mean().idxmin()
-                avg_savings = valid_price_df.groupby('platform')['price'].mean().max() - \
-                            valid_price_df.groupby('platform')['price'].mean().min()
+                platform_prices = valid_price_df.groupby('platform', sort=False, observed=True)['price'].mean()
+                cheapest_platform = platform_prices.idxmin()
+                avg_savings = platform_prices.max() - platform_prices.min()
                 
                 recommendations.append({
                     'type': 'price_optimization',
@@ -393,7 +400,7 @@ class PriceAnalyzer(BaseAnalyzer):
         
         # Quality-based recommendations
         if 'rating' in df.columns:
-            platform_ratings = df.groupby('platform')['rating'].mean()
+            platform_ratings = df.groupby('platform', sort=False, observed=True)['rating'].mean()
             if not platform_ratings.empty:
                 best_quality_platform = platform_ratings.idxmax()
                 
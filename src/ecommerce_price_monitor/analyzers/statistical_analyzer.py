@@ -38,7 +38,7 @@ class StatisticalAnalyzer(BaseAnalyzer):
         if isinstance(data, list):
             df = self.prepare_dataframe(data)
         else:
-            df = data.copy()
+            df = data
         
         confidence_level = kwargs.get('confidence_level', 0.95)
         outlier_method = kwargs.get('outlier_method', 'iqr')
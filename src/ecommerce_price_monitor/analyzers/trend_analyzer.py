@@ -38,7 +38,7 @@ class TrendAnalyzer(BaseAnalyzer):
         if isinstance(data, list):
             df = self.prepare_dataframe(data)
         else:
-            df = data.copy()
+            df = data
         
         if 'timestamp' not in df.columns or 'price' not in df.columns:
             raise ValueError("Timestamp and price columns are required for trend analysis")
@@ -10,6 +10,10 @@ from .base_collector import BaseCollector, ProductData
 from ..utils.exceptions import CollectorError
 
 
+# ASIN in any of the common URL forms (/gp/product/ is covered by /product/)
+_ASIN_RE = re.compile(r'(?:/dp/|/product/|asin=)([A-Z0-9]{10})')
+
+
 class AmazonCollector(BaseCollector):
     """Amazon-specific product data collector."""
     
@@ -293,20 +297,8 @@ class AmazonCollector(BaseCollector):
         Returns:
             ASIN or None if not found
         """
-        # Common Amazon URL patterns for ASIN extraction
-        patterns = [
-            r'/dp/([A-Z0-9]{10})',
-            r'/product/([A-Z0-9]{10})',
-            r'/gp/product/([A-Z0-9]{10})',
-            r'asin=([A-Z0-9]{10})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        match = _ASIN_RE.search(url)
+        return match.group(1) if match else None
     
     def _parse_price(self, price_text: str) -> float:
         """Parse price string to float.
@@ -327,4 +319,4 @@ class AmazonCollector(BaseCollector):
         try:
             return float(price_clean)
         except (ValueError, TypeError):
-            return 0.0
\ No newline at end of file
+            return 0.0
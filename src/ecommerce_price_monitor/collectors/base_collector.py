@@ -1,5 +1,6 @@
 """Base collector class for all e-commerce platform scrapers."""
 
+import sys
 import time
 import logging
 import requests
@@ -12,7 +13,12 @@ from ..config import config_manager
 from ..utils.exceptions import CollectorError, RateLimitError
 
 
-@dataclass
+# Slotted dataclass instances have no per-instance __dict__, which makes
+# them smaller and their attribute reads faster; slots=True needs Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ProductData:
     """Data structure for product information."""
     platform: str
@@ -204,7 +204,8 @@ class PriceCollector:
         
         return results
     
-    def _detect_platform(self, url: str) -> Optional[str]:
+    @staticmethod
+    def _detect_platform(url: str) -> Optional[str]:
         """Detect platform from URL.
         
         Args:
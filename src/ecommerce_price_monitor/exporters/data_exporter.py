@@ -3,10 +3,18 @@
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Union, Optional
 from datetime import datetime
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    # pyarrow is optional; only needed for csv_engine='pyarrow'
+    pa = None
+
 from ..utils.exceptions import ExporterError
 
 
@@ -32,7 +40,7 @@ class DataExporter:
             format: Output format ('csv', 'excel', 'json', 'markdown', 'html')
             filename: Output filename (without extension)
             output_dir: Output directory
-            **kwargs: Format-specific options
+            **kwargs: Format-specific options, e.g. csv_engine='pyarrow'
             
         Returns:
             Path to the exported file
@@ -65,15 +73,15 @@ class DataExporter:
             self.logger.error(f"Export failed for format {format}: {e}")
             raise ExporterError(f"Failed to export data as {format}: {e}")
     
-    def _export_csv(self, data, filename, output_dir, **kwargs):
+    def _export_csv(self, data, filename, output_dir, csv_engine='pandas', **kwargs):
         """Export data to CSV format."""
         filepath = os.path.join(output_dir, f"{filename}.csv")
         
         if isinstance(data, pd.DataFrame):
-            data.to_csv(filepath, index=False, encoding='utf-8')
+            self._write_csv(data, filepath, csv_engine)
         elif isinstance(data, list):
             df = pd.DataFrame(data)
-            df.to_csv(filepath, index=False, encoding='utf-8')
+            self._write_csv(df, filepath, csv_engine)
         else:
             # Handle analysis results or other objects
             if hasattr(data, 'to_dict'):
@@ -82,10 +90,33 @@ class DataExporter:
                 df = pd.DataFrame([data.data])
             else:
                 df = pd.DataFrame([str(data)])
-            df.to_csv(filepath, index=False, encoding='utf-8')
+            self._write_csv(df, filepath, csv_engine)
         
         return filepath
     
+    def _write_csv(self, df: pd.DataFrame, filepath: str, engine: str = 'pandas') -> None:
+        """Write a DataFrame as UTF-8 CSV.
+        
+        engine='pyarrow' opts into pyarrow's multi-threaded C++ writer, which
+        is much faster on large frames but formats differently from to_csv:
+        strings and the header are quoted, booleans are written as
+        true/false and timestamps carry nanoseconds. It falls back to pandas
+        when pyarrow is not installed or cannot represent the frame (e.g.
+        object columns holding nested analysis results).
+        """
+        if engine == 'pyarrow':
+            if pa is None:
+                self.logger.debug("pyarrow is not installed; writing CSV with pandas")
+            else:
+                try:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    pa_csv.write_csv(table, filepath)
+                    return
+                except pa.ArrowException as e:
+                    self.logger.debug(f"pyarrow CSV export unavailable for this frame: {e}")
+        
+        df.to_csv(filepath, index=False, encoding='utf-8')
+    
     def _export_excel(self, data, filename, output_dir, **kwargs):
         """Export data to Excel format."""
         filepath = os.path.join(output_dir, f"{filename}.xlsx")
@@ -209,15 +240,20 @@ class DataExporter:
         formats: List[str],
         base_filename: Optional[str] = None,
         output_dir: str = 'data/reports',
+        max_workers: int = 4,
         **kwargs
     ) -> Dict[str, str]:
         """Export data in multiple formats simultaneously.
         
+        Each format is written to its own file, so the exports run
+        concurrently in a ThreadPoolExecutor.
+        
         Args:
             data: Data to export
             formats: List of output formats
             base_filename: Base filename (without extension)
             output_dir: Output directory
+            max_workers: Maximum number of concurrent exports
             **kwargs: Format-specific options
             
         Returns:
@@ -227,18 +263,20 @@ class DataExporter:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             base_filename = f"price_analysis_{timestamp}"
         
-        results = {}
+        if not formats:
+            return {}
         
-        for format_name in formats:
+        def export(format_name):
             try:
                 file_path = self.export_data(
                     data, format_name, base_filename, output_dir, **kwargs
                 )
-                results[format_name] = file_path
                 self.logger.info(f"Successfully exported {format_name} to {file_path}")
+                return file_path
                 
             except Exception as e:
                 self.logger.error(f"Failed to export {format_name}: {e}")
-                results[format_name] = None
+                return None
         
-        return results
\ No newline at end of file
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(formats))) as executor:
+            return dict(zip(formats, executor.map(export, formats)))
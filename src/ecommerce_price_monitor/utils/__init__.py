@@ -9,14 +9,16 @@ from .exceptions import (
     ValidationError
 )
 from .logging_config import setup_logging
-from .database import DatabaseManager
+from .database import DatabaseManager, get_db_manager
 from .helpers import (
     format_currency,
     calculate_percentage_change,
+    calculate_percentage_change_array,
     normalize_product_name,
     extract_numeric_value,
     validate_url,
-    safe_divide
+    safe_divide,
+    safe_divide_array
 )
 
 __all__ = [
@@ -28,10 +30,13 @@ __all__ = [
     "ValidationError",
     "setup_logging",
     "DatabaseManager",
+    "get_db_manager",
     "format_currency",
     "calculate_percentage_change",
+    "calculate_percentage_change_array",
     "normalize_product_name",
     "extract_numeric_value",
     "validate_url",
-    "safe_divide"
+    "safe_divide",
+    "safe_divide_array"
 ]
\ No newline at end of file
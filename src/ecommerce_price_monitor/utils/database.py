@@ -2,9 +2,10 @@
 
 import sqlite3
 import logging
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
 import pandas as pd
 
 from ..config import config_manager
@@ -102,6 +103,75 @@ class DatabaseManager:
             self.logger.error(f"数据库初始化失败: {e}")
             raise DatabaseError(f"Failed to initialize database: {e}")
     
+    # 真正的 UPSERT：冲突时原地更新，保留 rowid 与 created_at
+    _PRODUCT_UPSERT_SQL = '''
+        INSERT INTO products (
+            platform, product_id, name, price, currency, availability,
+            url, image_url, rating, review_count, seller, category,
+            brand, description
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(platform, product_id) DO UPDATE SET
+            name = excluded.name,
+            price = excluded.price,
+            currency = excluded.currency,
+            availability = excluded.availability,
+            url = excluded.url,
+            image_url = excluded.image_url,
+            rating = excluded.rating,
+            review_count = excluded.review_count,
+            seller = excluded.seller,
+            category = excluded.category,
+            brand = excluded.brand,
+            description = excluded.description,
+            updated_at = CURRENT_TIMESTAMP
+    '''
+    
+    _PRICE_HISTORY_INSERT_SQL = '''
+        INSERT INTO price_history (platform, product_id, price, currency, availability)
+        VALUES (?, ?, ?, ?, ?)
+    '''
+    
+    @staticmethod
+    def _product_row(product_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """构建商品表参数元组 - Build the bound parameters for a product row."""
+        return (
+            product_data.get('platform'),
+            product_data.get('product_id'),
+            product_data.get('name'),
+            product_data.get('price'),
+            product_data.get('currency', 'USD'),
+            product_data.get('availability'),
+            product_data.get('url'),
+            product_data.get('image_url'),
+            product_data.get('rating'),
+            product_data.get('review_count'),
+            product_data.get('seller'),
+            product_data.get('category'),
+            product_data.get('brand'),
+            product_data.get('description')
+        )
+    
+    @staticmethod
+    def _price_history_row(product_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """构建价格历史参数元组 - Build the bound parameters for a price history row."""
+        return (
+            product_data.get('platform'),
+            product_data.get('product_id'),
+            product_data.get('price'),
+            product_data.get('currency', 'USD'),
+            product_data.get('availability')
+        )
+    
+    @staticmethod
+    def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """将查询结果转换为字典列表 - Convert fetched rows to dicts.
+        
+        Column names are read from the cursor description once and shared
+        by every row instead of being looked up per sqlite3.Row.
+        """
+        columns = [sys.intern(description[0]) for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
     def save_product(self, product_data: Dict[str, Any]) -> bool:
         """保存商品数据.
         
@@ -115,43 +185,12 @@ class DatabaseManager:
             with sqlite3.connect(str(self.db_path)) as conn:
                 cursor = conn.cursor()
                 
-                # 插入或更新商品数据
-                cursor.execute('''
-                    INSERT OR REPLACE INTO products (
-                        platform, product_id, name, price, currency, availability,
-                        url, image_url, rating, review_count, seller, category,
-                        brand, description, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    product_data.get('platform'),
-                    product_data.get('product_id'),
-                    product_data.get('name'),
-                    product_data.get('price'),
-                    product_data.get('currency', 'USD'),
-                    product_data.get('availability'),
-                    product_data.get('url'),
-                    product_data.get('image_url'),
-                    product_data.get('rating'),
-                    product_data.get('review_count'),
-                    product_data.get('seller'),
-                    product_data.get('category'),
-                    product_data.get('brand'),
-                    product_data.get('description'),
-                    datetime.now()
-                ))
+                # 插入或更新商品数据（updated_at 由数据库生成）
+                cursor.execute(self._PRODUCT_UPSERT_SQL, self._product_row(product_data))
                 
                 # 保存价格历史
                 if product_data.get('price') is not None:
-                    cursor.execute('''
-                        INSERT INTO price_history (platform, product_id, price, currency, availability)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        product_data.get('platform'),
-                        product_data.get('product_id'),
-                        product_data.get('price'),
-                        product_data.get('currency', 'USD'),
-                        product_data.get('availability')
-                    ))
+                    cursor.execute(self._PRICE_HISTORY_INSERT_SQL, self._price_history_row(product_data))
                 
                 conn.commit()
                 return True
@@ -163,17 +202,38 @@ class DatabaseManager:
     def save_products_batch(self, products_data: List[Dict[str, Any]]) -> int:
         """批量保存商品数据.
         
+        所有商品在同一个事务中通过 executemany 写入；如果批量写入失败，
+        则逐条保存以便统计成功数量。
+        
         Args:
             products_data: 商品数据列表
             
         Returns:
             成功保存的商品数量
         """
-        saved_count = 0
+        if not products_data:
+            return 0
         
-        for product_data in products_data:
-            if self.save_product(product_data):
-                saved_count += 1
+        try:
+            with sqlite3.connect(str(self.db_path)) as conn:
+                cursor = conn.cursor()
+                
+                cursor.executemany(
+                    self._PRODUCT_UPSERT_SQL,
+                    [self._product_row(product_data) for product_data in products_data]
+                )
+                cursor.executemany(
+                    self._PRICE_HISTORY_INSERT_SQL,
+                    [self._price_history_row(product_data) for product_data in products_data
+                     if product_data.get('price') is not None]
+                )
+                
+                conn.commit()
+                saved_count = len(products_data)
+                
+        except Exception as e:
+            self.logger.warning(f"批量写入失败，改为逐条保存: {e}")
+            saved_count = sum(1 for product_data in products_data if self.save_product(product_data))
         
         self.logger.info(f"批量保存完成: {saved_count}/{len(products_data)} 个商品")
         return saved_count
@@ -220,17 +280,16 @@ class DatabaseManager:
         """
         try:
             with sqlite3.connect(str(self.db_path)) as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
                 cursor.execute('''
                     SELECT * FROM price_history 
                     WHERE platform = ? AND product_id = ?
-                    AND timestamp >= datetime('now', '-{} days')
+                    AND timestamp >= datetime('now', ?)
                     ORDER BY timestamp DESC
-                '''.format(days), (platform, product_id))
+                ''', (platform, product_id, f'-{int(days)} days'))
                 
-                return [dict(row) for row in cursor.fetchall()]
+                return self._fetch_dicts(cursor)
                 
         except Exception as e:
             self.logger.error(f"获取价格历史失败: {e}")
@@ -249,7 +308,6 @@ class DatabaseManager:
         """
         try:
             with sqlite3.connect(str(self.db_path)) as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
                 sql = '''
@@ -266,7 +324,7 @@ class DatabaseManager:
                 params.append(limit)
                 
                 cursor.execute(sql, params)
-                return [dict(row) for row in cursor.fetchall()]
+                return self._fetch_dicts(cursor)
                 
         except Exception as e:
             self.logger.error(f"搜索商品失败: {e}")
@@ -304,23 +362,24 @@ class DatabaseManager:
             with sqlite3.connect(str(self.db_path)) as conn:
                 cursor = conn.cursor()
                 
-                stats = {}
-                
-                # 商品总数
-                cursor.execute('SELECT COUNT(*) FROM products')
-                stats['total_products'] = cursor.fetchone()[0]
+                # 三个总数在一次查询中取得
+                cursor.execute('''
+                    SELECT
+                        (SELECT COUNT(*) FROM products),
+                        (SELECT COUNT(*) FROM price_history),
+                        (SELECT COUNT(*) FROM search_history)
+                ''')
+                total_products, total_price_records, total_searches = cursor.fetchone()
                 
                 # 各平台商品数量
                 cursor.execute('SELECT platform, COUNT(*) FROM products GROUP BY platform')
-                stats['products_by_platform'] = dict(cursor.fetchall())
-                
-                # 价格历史记录数
-                cursor.execute('SELECT COUNT(*) FROM price_history')
-                stats['total_price_records'] = cursor.fetchone()[0]
                 
-                # 搜索历史数
-                cursor.execute('SELECT COUNT(*) FROM search_history')
-                stats['total_searches'] = cursor.fetchone()[0]
+                stats = {
+                    'total_products': total_products,
+                    'products_by_platform': dict(cursor.fetchall()),
+                    'total_price_records': total_price_records,
+                    'total_searches': total_searches
+                }
                 
                 return stats
                 
@@ -360,17 +419,19 @@ class DatabaseManager:
             with sqlite3.connect(str(self.db_path)) as conn:
                 cursor = conn.cursor()
                 
+                cutoff = (f'-{int(days)} days',)
+                
                 # 清理旧的价格历史记录
                 cursor.execute('''
                     DELETE FROM price_history 
-                    WHERE timestamp < datetime('now', '-{} days')
-                '''.format(days))
+                    WHERE timestamp < datetime('now', ?)
+                ''', cutoff)
                 
                 # 清理旧的搜索历史
                 cursor.execute('''
                     DELETE FROM search_history 
-                    WHERE timestamp < datetime('now', '-{} days')
-                '''.format(days))
+                    WHERE timestamp < datetime('now', ?)
+                ''', cutoff)
                 
                 conn.commit()
                 
@@ -384,5 +445,14 @@ class DatabaseManager:
         self.logger.info("数据库管理器已关闭")
 
 
-# 全局数据库管理器实例
-db_manager = DatabaseManager()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_db_manager() -> DatabaseManager:
+    """获取全局数据库管理器实例 - Get the shared database manager.
+    
+    The manager is created on first use rather than at import time, so
+    importing the package does not touch the filesystem or the database.
+    
+    Returns:
+        共享的数据库管理器实例
+    """
+    return DatabaseManager()
\ No newline at end of file
@@ -1,10 +1,39 @@
 """Helper utility functions."""
 
+import hashlib
+import html
 import re
+import sys
 import unicodedata
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Union
 from urllib.parse import urlparse
 
+import numpy as np
+
+
+ArrayLike = Union[np.ndarray, Sequence[float]]
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+# http(s) URL with a non-empty host; bracketed IPv6 hosts go through urlparse
+_HTTP_URL_RE = re.compile(r'https?://[^/?#\[\]]', re.IGNORECASE)
+# Whole whitespace-delimited tokens only, so "brand-new" is left untouched
+_FILLER_WORDS_RE = re.compile(r'(?<!\S)(?:new|original|genuine|official|brand|item)(?!\S)')
+
+
+@lru_cache(maxsize=None)
+def _combining_marks_table() -> Dict[int, None]:
+    """Build a str.translate table that deletes all nonspacing marks (Mn).
+    
+    Built on first use rather than at import, since scanning every code
+    point takes around a tenth of a second.
+    """
+    return dict.fromkeys(
+        code_point for code_point in range(sys.maxunicode + 1)
+        if unicodedata.category(chr(code_point)) == 'Mn'
+    )
+
 
 def format_currency(amount: float, currency: str = "USD", decimal_places: int = 2) -> str:
     """Format a currency amount for display.
@@ -54,6 +83,27 @@ def calculate_percentage_change(old_value: float, new_value: float) -> float:
     return ((new_value - old_value) / old_value) * 100
 
 
+def calculate_percentage_change_array(old_values: ArrayLike, new_values: ArrayLike) -> np.ndarray:
+    """Calculate element-wise percentage change between two arrays.
+    
+    Vectorized counterpart of calculate_percentage_change for whole
+    price columns; zero old values follow the same rules as the scalar version.
+    
+    Args:
+        old_values: Original values
+        new_values: New values
+        
+    Returns:
+        Array of percentage changes
+    """
+    old = np.asarray(old_values, dtype=np.float64)
+    new = np.asarray(new_values, dtype=np.float64)
+    
+    zero_old = old == 0
+    change = (new - old) / np.where(zero_old, 1.0, old) * 100
+    return np.where(zero_old, np.where(new > 0, 100.0, 0.0), change)
+
+
 def normalize_product_name(name: str) -> str:
     """Normalize product name for comparison and matching.
     
@@ -80,20 +130,14 @@ def normalize_product_name(name: str) -> str:
     # Convert to lowercase
     normalized = name.lower()
     
-    # Remove accents and special characters
-    normalized = unicodedata.normalize('NFD', normalized)
-    normalized = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-    
-    # Remove extra whitespace and common words
-    normalized = re.sub(r'\s+', ' ', normalized)
-    normalized = normalized.strip()
-    
-    # Remove common filler words
-    filler_words = ['new', 'original', 'genuine', 'official', 'brand', 'item']
-    words = normalized.split()
-    words = [word for word in words if word not in filler_words]
+    # Remove accents and special characters (ASCII input has none)
+    if not normalized.isascii():
+        normalized = unicodedata.normalize('NFD', normalized)
+        normalized = normalized.translate(_combining_marks_table())
     
-    return ' '.join(words)
+    # Remove common filler words and extra whitespace
+    normalized = _FILLER_WORDS_RE.sub('', normalized)
+    return _WHITESPACE_RE.sub(' ', normalized).strip()
 
 
 def extract_numeric_value(text: str) -> Optional[float]:
@@ -135,6 +179,10 @@ def validate_url(url: str) -> bool:
     if not url:
         return False
     
+    # Fast path for the common http(s) case
+    if _HTTP_URL_RE.match(url):
+        return True
+    
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -157,6 +205,23 @@ def safe_divide(numerator: Union[int, float], denominator: Union[int, float]) ->
     return numerator / denominator
 
 
+def safe_divide_array(numerator: ArrayLike, denominator: ArrayLike) -> np.ndarray:
+    """Safely divide two arrays element-wise, yielding 0 where denominator is 0.
+    
+    Args:
+        numerator: Values to divide
+        denominator: Values to divide by
+        
+    Returns:
+        Array of division results
+    """
+    num = np.asarray(numerator, dtype=np.float64)
+    den = np.asarray(denominator, dtype=np.float64)
+    
+    zero_den = den == 0
+    return np.where(zero_den, 0.0, num / np.where(zero_den, 1.0, den))
+
+
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """Truncate text to a maximum length.
     
@@ -188,23 +253,13 @@ def clean_html_text(text: str) -> str:
         return ""
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # Replace common HTML entities
-    entities = {
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#39;': "'",
-        '&nbsp;': ' ',
-    }
+    text = _HTML_TAG_RE.sub('', text)
     
-    for entity, replacement in entities.items():
-        text = text.replace(entity, replacement)
+    # Decode HTML entities (named and numeric) in a single pass
+    text = html.unescape(text)
     
     # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     return text.strip()
 
 
@@ -219,11 +274,9 @@ def generate_product_hash(platform: str, product_id: str, name: str) -> str:
     Returns:
         Unique hash string
     """
-    import hashlib
-    
     # Create a unique string from platform, ID, and normalized name
     normalized_name = normalize_product_name(name)
     unique_string = f"{platform.lower()}:{product_id}:{normalized_name}"
     
-    # Generate SHA-256 hash
+    # Truncated SHA-256; stored hashes depend on this exact digest
     return hashlib.sha256(unique_string.encode('utf-8')).hexdigest()[:16]
\ No newline at end of file
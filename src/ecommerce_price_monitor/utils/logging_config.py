@@ -129,10 +129,11 @@ def setup_logging(
     
     # Log the setup
     logger = logging.getLogger('ecommerce_price_monitor.setup')
-    logger.info(f"Logging configured - Level: {log_level}, Console: {console_output}, File: {file_output}")
+    logger.info("Logging configured - Level: %s, Console: %s, File: %s",
+                log_level, console_output, file_output)
     
     if file_output:
-        logger.info(f"Log files: {log_filename}, {error_log_filename}")
+        logger.info("Log files: %s, %s", log_filename, error_log_filename)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -160,9 +161,23 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, *args, use_color: bool = True, **kwargs):
+        """Initialize the formatter.
+        
+        Args:
+            *args: Positional arguments for logging.Formatter
+            use_color: Whether to wrap messages in ANSI color codes; pass
+                False when the handler's stream is not a terminal
+            **kwargs: Keyword arguments for logging.Formatter
+        """
+        super().__init__(*args, **kwargs)
+        self.use_color = use_color
+    
     def format(self, record):
         """Format the log record with colors."""
         log_message = super().format(record)
+        if not self.use_color:
+            return log_message
         color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
         return f"{color}{log_message}{self.COLORS['RESET']}"
 
@@ -173,14 +188,18 @@ def setup_colored_logging(log_level: str = "INFO") -> None:
     Args:
         log_level: Logging level
     """
-    # Create colored formatter
+    console_handler = logging.StreamHandler()
+    
+    # Create colored formatter; colors are only emitted when the handler's
+    # stream is a terminal
+    stream = console_handler.stream
     colored_formatter = ColoredFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        datefmt='%Y-%m-%d %H:%M:%S',
+        use_color=hasattr(stream, 'isatty') and stream.isatty()
     )
     
     # Setup console handler with colored formatter
-    console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(colored_formatter)
     
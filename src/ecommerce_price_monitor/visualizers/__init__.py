@@ -1,7 +1,26 @@
 """Visualization modules for price monitoring data."""
 
-from .base_visualizer import BaseVisualizer
-from .price_visualizer import PriceVisualizer
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_visualizer import BaseVisualizer
+    from .price_visualizer import PriceVisualizer
+
+# Imported on first access, so importing base_visualizer alone does not
+# pull in plotly and seaborn through price_visualizer
+_LAZY_IMPORTS = {
+    "BaseVisualizer": ".base_visualizer",
+    "PriceVisualizer": ".price_visualizer",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "BaseVisualizer",
@@ -1,40 +1,206 @@
 """Base visualizer class for all chart types."""
 
+import io
 import logging
-import os
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import cycle, islice
+from operator import attrgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Iterable, Mapping, Optional, Sequence, Union, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Plotly and seaborn are imported where they are used, so subclasses that
+# only draw with Matplotlib do not pay their import cost
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 from ..collectors.base_collector import ProductData
 from ..config import config_manager
 from ..utils.exceptions import ExporterError
 
 
+# ProductData fields exposed as DataFrame columns, in column order
+_PRODUCT_COLUMNS = (
+    'platform', 'product_id', 'name', 'price', 'currency', 'availability',
+    'url', 'image_url', 'rating', 'review_count', 'seller', 'category',
+    'brand', 'description', 'timestamp'
+)
+
+_product_fields = attrgetter(*_PRODUCT_COLUMNS)
+
+# Plotting dtypes: ratings need far less than float64 precision, but prices
+# stay float64 since float32 drops cents above about 131k (1234567.89 would
+# read 1234567.875). Review counts are nullable, so they use masked Int32
+_NUMERIC_DTYPES = {'price': np.float64, 'rating': np.float32}
+_REVIEW_COUNT_DTYPE = 'Int32'
+
+
+@lru_cache(maxsize=None)
+def _figure_kind(figure_type: type) -> Optional[str]:
+    """Classify a figure type as 'matplotlib' or 'plotly' without importing plotly.
+    
+    A Plotly figure can only exist once plotly has been imported, so its
+    base class is looked up in sys.modules rather than imported here.
+    """
+    if issubclass(figure_type, plt.Figure):
+        return 'matplotlib'
+    plotly_types = sys.modules.get('plotly.basedatatypes')
+    if plotly_types is not None and issubclass(figure_type, plotly_types.BaseFigure):
+        return 'plotly'
+    return None
+
+
+@lru_cache(maxsize=None)
+def _ensure_output_dir(output_dir: str) -> Path:
+    """Create an output directory once per process and return its path."""
+    path = Path(output_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _save_to_output_dir(save: Callable[[], None], output_dir: str) -> None:
+    """Run save, recreating output_dir and retrying once if it has gone.
+    
+    _ensure_output_dir only creates a directory the first time it is seen,
+    so one removed after that is noticed when a save into it fails.
+    """
+    try:
+        save()
+    except FileNotFoundError:
+        _ensure_output_dir.cache_clear()
+        _ensure_output_dir(output_dir)
+        save()
+
+
+# Kaleido's sync server answers calls through one shared task/result queue
+# pair, so concurrent write_image calls are serialized to keep replies paired
+_kaleido_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _start_kaleido_server() -> bool:
+    """Start Kaleido's persistent browser server once per process.
+    
+    Kaleido >= 1 otherwise launches a new Chrome for every write_image call.
+    Kaleido stops the server itself at exit. Returns False when Kaleido is
+    missing or predates start_sync_server, leaving write_image as it was.
+    """
+    try:
+        import kaleido
+    except ImportError:
+        return False
+    start = getattr(kaleido, 'start_sync_server', None)
+    if start is None:
+        return False
+    start(silence_warnings=True)
+    return True
+
+
+@lru_cache(maxsize=32)
+def _palette(palette_name: str, n_colors: Optional[int]) -> Tuple[str, ...]:
+    """Look up a named palette, truncated or cycled to n_colors if given."""
+    palette = _COLOR_PALETTES.get(palette_name, _COLOR_PALETTES['primary'])
+    if n_colors is None:
+        return palette
+    return tuple(islice(cycle(palette), n_colors))
+
+
+# Color palettes and chart themes are shared, read-only module constants
+_COLOR_PALETTES = MappingProxyType({
+    'primary': ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b'),
+    'pastel': ('#aec7e8', '#ffbb78', '#98df8a', '#ff9896', '#c5b0d5', '#c49c94'),
+    'dark': ('#17202A', '#E74C3C', '#3498DB', '#2ECC71', '#F39C12', '#9B59B6'),
+    'modern': ('#3b82f6', '#ef4444', '#10b981', '#f59e0b', '#8b5cf6', '#06b6d4')
+})
+
+_CHART_THEMES = MappingProxyType({
+    'default': MappingProxyType({
+        'background_color': 'white',
+        'grid_color': '#f0f0f0',
+        'text_color': '#333333',
+        'font_family': 'Arial, sans-serif'
+    }),
+    'dark': MappingProxyType({
+        'background_color': '#2e2e2e',
+        'grid_color': '#444444',
+        'text_color': '#ffffff',
+        'font_family': 'Arial, sans-serif'
+    }),
+    'minimal': MappingProxyType({
+        'background_color': 'white',
+        'grid_color': '#e0e0e0',
+        'text_color': '#666666',
+        'font_family': 'Helvetica, sans-serif'
+    }),
+    'colorful': MappingProxyType({
+        'background_color': '#f8f9fa',
+        'grid_color': '#dee2e6',
+        'text_color': '#212529',
+        'font_family': 'Roboto, sans-serif'
+    })
+})
+
+# Matplotlib savefig settings per save_chart quality tier
+_SAVE_QUALITY = {
+    'print': {'dpi': 300, 'bbox_inches': 'tight'},
+    'preview': {'dpi': 100, 'bbox_inches': None},
+}
+
+# Currency symbols prefixed by format_currency and format_currency_series
+_CURRENCY_SYMBOLS = {'USD': '$', 'EUR': '€', 'GBP': '£'}
+
+# Per-currency formatters; other currencies get the code as a suffix
+_CURRENCY_FORMATTERS = {
+    currency: (symbol + '{:,.2f}').format
+    for currency, symbol in _CURRENCY_SYMBOLS.items()
+}
+
+
 class BaseVisualizer(ABC):
     """Abstract base class for all visualizers."""
     
+    # Matplotlib rcParams and the seaborn theme are process-wide, so the
+    # default styling only needs to be applied once
+    _styling_applied = False
+    
+    # How HTML charts load plotly.js: True embeds the ~3MB bundle so reports
+    # render offline; set to 'cdn' to link it instead and keep files small
+    plotlyjs_source: Union[bool, str] = True
+    
+    # Figure type -> handler method name, used by save_chart and add_watermark
+    _SAVE_HANDLERS = {'matplotlib': '_save_matplotlib', 'plotly': '_save_plotly'}
+    _WATERMARK_HANDLERS = {'matplotlib': '_watermark_matplotlib', 'plotly': '_watermark_plotly'}
+    
+    # Resolved once per class rather than on every instantiation
+    logger = logging.getLogger('BaseVisualizer')
+    
+    def __init_subclass__(cls, **kwargs):
+        """Give each visualizer subclass its own class-level logger."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+    
     def __init__(self):
         """Initialize the base visualizer."""
         self.config = config_manager.load_config()
-        self.logger = logging.getLogger(self.__class__.__name__)
         
         # Set up default styling
-        self._setup_styling()
-        
-        # Color palettes
-        self.color_palettes = {
-            'primary': ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b'],
-            'pastel': ['#aec7e8', '#ffbb78', '#98df8a', '#ff9896', '#c5b0d5', '#c49c94'],
-            'dark': ['#17202A', '#E74C3C', '#3498DB', '#2ECC71', '#F39C12', '#9B59B6'],
-            'modern': ['#3b82f6', '#ef4444', '#10b981', '#f59e0b', '#8b5cf6', '#06b6d4']
-        }
+        if not BaseVisualizer._styling_applied:
+            self._setup_styling()
+            BaseVisualizer._styling_applied = True
+    
+    @property
+    def color_palettes(self) -> Mapping[str, Tuple[str, ...]]:
+        """Available color palettes by name."""
+        return _COLOR_PALETTES
     
     def _setup_styling(self):
         """Set up default styling for all plots."""
@@ -48,6 +214,7 @@ class BaseVisualizer(ABC):
         plt.rcParams['legend.fontsize'] = 11
         
         # Seaborn styling
+        import seaborn as sns
         sns.set_theme(style="whitegrid", palette="husl")
     
     @abstractmethod
@@ -55,7 +222,7 @@ class BaseVisualizer(ABC):
         self, 
         data: Union[List[ProductData], pd.DataFrame, Dict[str, Any]], 
         **kwargs
-    ) -> Union[plt.Figure, go.Figure]:
+    ) -> Union[plt.Figure, 'go.Figure']:
         """Create a chart from the provided data.
         
         Args:
@@ -70,6 +237,11 @@ class BaseVisualizer(ABC):
     def prepare_dataframe(self, products: List[ProductData]) -> pd.DataFrame:
         """Convert list of ProductData to pandas DataFrame.
         
+        Rating is stored as float32 and review_count as Int32 to halve the
+        bytes passed through the plotting pipeline; price stays float64 so
+        large prices keep their cents. Callers doing cumulative arithmetic
+        over many ratings should upcast locally.
+        
         Args:
             products: List of product data
             
@@ -79,107 +251,218 @@ class BaseVisualizer(ABC):
         if not products:
             return pd.DataFrame()
         
-        data = []
-        for product in products:
-            row = {
-                'platform': product.platform,
-                'product_id': product.product_id,
-                'name': product.name,
-                'price': product.price,
-                'currency': product.currency,
-                'availability': product.availability,
-                'url': product.url,
-                'image_url': product.image_url,
-                'rating': product.rating,
-                'review_count': product.review_count,
-                'seller': product.seller,
-                'category': product.category,
-                'brand': product.brand,
-                'description': product.description,
-                'timestamp': product.timestamp
-            }
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        
-        # Convert timestamp to datetime if not already
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-        
-        return df
+        # Extract one tuple per product, then transpose into columns so pandas
+        # builds each column from a flat list instead of one dict per row
+        columns = zip(*map(_product_fields, products))
+        data = dict(zip(_PRODUCT_COLUMNS, map(list, columns)))
+        
+        # Give numeric columns their dtype up front so pandas does not have to
+        # infer it from Python objects; missing values become NaN/<NA>
+        for column, dtype in _NUMERIC_DTYPES.items():
+            data[column] = np.array(data[column], dtype=dtype)
+        data['review_count'] = pd.array(data['review_count'], dtype=_REVIEW_COUNT_DTYPE)
+        data['timestamp'] = pd.to_datetime(data['timestamp'], cache=True)
+        
+        return pd.DataFrame(data, copy=False)
     
     def save_chart(
         self, 
-        figure: Union[plt.Figure, go.Figure], 
+        figure: Union[plt.Figure, 'go.Figure'], 
         filename: str, 
         format: str = 'png',
-        output_dir: str = 'data/reports'
-    ) -> str:
+        output_dir: Optional[str] = 'data/reports',
+        quality: str = 'print',
+        timestamp: Optional[str] = None
+    ) -> Union[str, io.BytesIO]:
         """Save chart to file.
         
         Args:
             figure: Figure object to save
             filename: Base filename (without extension)
             format: Output format ('png', 'jpg', 'svg', 'html', 'pdf')
-            output_dir: Output directory
+            output_dir: Output directory, or None to render into memory
+            quality: 'print' (300 DPI, tight bounding box) or 'preview'
+                (100 DPI, no extra bounding-box render pass)
+            timestamp: Filename timestamp; batch callers can compute it once
+                and pass it to every save. Defaults to the current time
             
         Returns:
-            Full path to saved file
+            Full path to saved file, or a BytesIO positioned at the start
+            when output_dir is None
         """
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        if quality not in _SAVE_QUALITY:
+            raise ValueError(f"Unsupported quality: {quality}")
         
-        # Add timestamp to filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        full_filename = f"{filename}_{timestamp}.{format}"
-        file_path = os.path.join(output_dir, full_filename)
+        if output_dir is None:
+            target = io.BytesIO()
+            destination = "<memory>"
+        else:
+            # Add timestamp to filename; the output directory is created
+            # the first time it is seen and recreated if it has been removed
+            if timestamp is None:
+                timestamp = self.export_timestamp()
+            target = destination = _ensure_output_dir(output_dir) / f"{filename}_{timestamp}.{format}"
         
         try:
-            if isinstance(figure, plt.Figure):
-                # Matplotlib figure
-                figure.savefig(
-                    file_path, 
-                    dpi=300, 
-                    bbox_inches='tight',
-                    facecolor='white',
-                    edgecolor='none'
-                )
-            elif isinstance(figure, go.Figure):
-                # Plotly figure
-                if format.lower() == 'html':
-                    figure.write_html(file_path)
-                else:
-                    figure.write_image(file_path, width=1200, height=800)
-            else:
+            save = self._get_figure_handler(self._SAVE_HANDLERS, figure)
+            if save is None:
                 raise ValueError(f"Unsupported figure type: {type(figure)}")
+            if output_dir is None:
+                save(figure, target, format, quality)
+            else:
+                _save_to_output_dir(lambda: save(figure, target, format, quality), output_dir)
                 
-            self.logger.info(f"Chart saved to: {file_path}")
-            return file_path
+            self.logger.info("Chart saved to: %s", destination)
+            if isinstance(target, io.BytesIO):
+                target.seek(0)
+                return target
+            return str(target)
             
         except Exception as e:
-            self.logger.error(f"Error saving chart: {e}")
+            self.logger.error("Error saving chart: %s", e)
             raise ExporterError(f"Failed to save chart: {e}")
     
-    def get_color_palette(self, palette_name: str = 'primary', n_colors: Optional[int] = None) -> List[str]:
-        """Get color palette for charts.
+    def save_chart_batch(
+        self,
+        figures: Iterable[plt.Figure],
+        filenames: Iterable[str],
+        format: str = 'png',
+        output_dir: str = 'data/reports',
+        quality: str = 'print',
+        timestamp: Optional[str] = None
+    ) -> List[str]:
+        """Save several Matplotlib figures through one shared Agg canvas.
+        
+        Each figure is attached to the same canvas in turn, so the Agg
+        renderer is reused between saves of equally sized figures instead
+        of being rebuilt per chart. Original canvases are restored after
+        each save.
         
         Args:
-            palette_name: Name of the color palette
-            n_colors: Number of colors needed
+            figures: Matplotlib figures to save
+            filenames: Base filenames (without extension), one per figure
+            format: Output format ('png', 'jpg', 'svg', 'pdf')
+            output_dir: Output directory
+            quality: 'print' or 'preview', as for save_chart
+            timestamp: Filename timestamp, as for save_chart
             
         Returns:
-            List of color hex codes
+            Full paths to the saved files, in input order
         """
-        palette = self.color_palettes.get(palette_name, self.color_palettes['primary'])
+        figures = list(figures)
+        filenames = list(filenames)
+        if len(figures) != len(filenames):
+            raise ValueError("figures and filenames must have the same length")
+        if quality not in _SAVE_QUALITY:
+            raise ValueError(f"Unsupported quality: {quality}")
         
-        if n_colors is None:
-            return palette
+        settings = _SAVE_QUALITY[quality]
+        directory = _ensure_output_dir(output_dir)
+        if timestamp is None:
+            timestamp = self.export_timestamp()
+        canvas = None
+        paths = []
         
-        # If we need more colors than available, cycle through the palette
-        if n_colors > len(palette):
-            return (palette * (n_colors // len(palette) + 1))[:n_colors]
+        try:
+            for figure, filename in zip(figures, filenames):
+                path = directory / f"{filename}_{timestamp}.{format}"
+                original_canvas = figure.canvas
+                if canvas is None:
+                    canvas = FigureCanvasAgg(figure)
+                else:
+                    canvas.figure = figure
+                    figure.set_canvas(canvas)
+                try:
+                    if settings['bbox_inches'] is None:
+                        figure.tight_layout()
+                    _save_to_output_dir(lambda: canvas.print_figure(
+                        path,
+                        format=format,
+                        dpi=settings['dpi'],
+                        bbox_inches=settings['bbox_inches'],
+                        facecolor='white',
+                        edgecolor='none'
+                    ), output_dir)
+                finally:
+                    figure.set_canvas(original_canvas)
+                paths.append(str(path))
+        except Exception as e:
+            self.logger.error("Error saving chart batch: %s", e)
+            raise ExporterError(f"Failed to save chart batch: {e}")
+        
+        self.logger.info("Saved %d charts to: %s", len(paths), output_dir)
+        return paths
+    
+    def save_charts(
+        self,
+        charts: Sequence[Tuple[Union[plt.Figure, 'go.Figure'], str]],
+        format: str = 'png',
+        output_dir: str = 'data/reports',
+        quality: str = 'print',
+        max_workers: int = 4
+    ) -> List[str]:
+        """Save several charts, saving Plotly figures concurrently.
+        
+        Plotly figures are saved in a ThreadPoolExecutor; image exports
+        queue on Kaleido's single browser server while other figures are
+        serialized. Matplotlib is not thread-safe and its Agg drawing holds
+        the GIL, so Matplotlib figures are saved serially through
+        save_chart_batch instead.
+        
+        Args:
+            charts: (figure, filename) pairs, as passed to save_chart
+            format: Output format ('png', 'jpg', 'svg', 'html', 'pdf')
+            output_dir: Output directory
+            quality: 'print' or 'preview', as for save_chart
+            max_workers: Maximum number of concurrent Plotly saves
+            
+        Returns:
+            Full paths to the saved files, in input order
+        """
+        timestamp = self.export_timestamp()
+        paths: List[Optional[str]] = [None] * len(charts)
+        matplotlib_positions = [
+            position for position, (figure, _) in enumerate(charts)
+            if _figure_kind(type(figure)) == 'matplotlib'
+        ]
+        other_positions = sorted(set(range(len(charts))).difference(matplotlib_positions))
         
-        return palette[:n_colors]
+        if matplotlib_positions:
+            saved = self.save_chart_batch(
+                [charts[position][0] for position in matplotlib_positions],
+                [charts[position][1] for position in matplotlib_positions],
+                format, output_dir, quality, timestamp
+            )
+            for position, path in zip(matplotlib_positions, saved):
+                paths[position] = path
+        
+        if other_positions:
+            def save(position):
+                figure, filename = charts[position]
+                return self.save_chart(figure, filename, format, output_dir, quality, timestamp)
+            
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(other_positions))) as executor:
+                for position, path in zip(other_positions, executor.map(save, other_positions)):
+                    paths[position] = path
+        
+        return paths
+    
+    @staticmethod
+    def export_timestamp() -> str:
+        """Get the timestamp string used in saved chart filenames."""
+        return datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    def get_color_palette(self, palette_name: str = 'primary', n_colors: Optional[int] = None) -> Tuple[str, ...]:
+        """Get color palette for charts.
+        
+        Args:
+            palette_name: Name of the color palette
+            n_colors: Number of colors needed
+            
+        Returns:
+            Tuple of color hex codes
+        """
+        return _palette(palette_name, n_colors)
     
     def format_currency(self, amount: float, currency: str = 'USD') -> str:
         """Format currency for display.
@@ -191,37 +474,104 @@ class BaseVisualizer(ABC):
         Returns:
             Formatted currency string
         """
-        if currency == 'USD':
-            return f'${amount:,.2f}'
-        elif currency == 'EUR':
-            return f'€{amount:,.2f}'
-        elif currency == 'GBP':
-            return f'£{amount:,.2f}'
-        else:
+        formatter = _CURRENCY_FORMATTERS.get(currency)
+        if formatter is None:
             return f'{amount:,.2f} {currency}'
+        return formatter(amount)
+    
+    def format_currency_series(self, amounts: pd.Series, currency: str = 'USD') -> pd.Series:
+        """Format a whole column of amounts for display.
+        
+        Produces the same strings as format_currency. Only the distinct
+        amounts are formatted (price columns repeat heavily), then expanded
+        back by their codes, and the currency symbol is added in a single
+        vectorized concatenation.
+        
+        Args:
+            amounts: Amounts to format
+            currency: Currency code
+            
+        Returns:
+            Series of formatted currency strings
+        """
+        amounts = pd.Series(amounts)
+        codes, uniques = pd.factorize(amounts, use_na_sentinel=False)
+        formatted_uniques = np.array([f'{amount:,.2f}' for amount in uniques], dtype=object)
+        formatted = pd.Series(formatted_uniques[codes], index=amounts.index)
+        symbol = _CURRENCY_SYMBOLS.get(currency)
+        if symbol is not None:
+            return symbol + formatted
+        return formatted + f' {currency}'
     
-    def add_watermark(self, figure: Union[plt.Figure, go.Figure], text: str = "E-commerce Price Monitor"):
+    def add_watermark(self, figure: Union[plt.Figure, 'go.Figure'], text: str = "E-commerce Price Monitor"):
         """Add watermark to the figure.
         
         Args:
             figure: Figure to add watermark to
             text: Watermark text
         """
-        if isinstance(figure, plt.Figure):
-            # Matplotlib watermark
-            figure.text(0.99, 0.01, text, fontsize=8, color='gray', alpha=0.5,
-                       ha='right', va='bottom', transform=figure.transFigure)
-        elif isinstance(figure, go.Figure):
-            # Plotly watermark
-            figure.add_annotation(
-                text=text,
-                xref="paper", yref="paper",
-                x=0.99, y=0.01,
-                xanchor="right", yanchor="bottom",
-                font=dict(size=10, color="gray"),
-                opacity=0.5,
-                showarrow=False
-            )
+        add_watermark = self._get_figure_handler(self._WATERMARK_HANDLERS, figure)
+        if add_watermark is not None:
+            add_watermark(figure, text)
+    
+    def _get_figure_handler(self, handlers: Dict[str, str], figure: Any) -> Optional[Callable]:
+        """Resolve the bound handler method for a figure.
+        
+        The figure kind is cached per type, so repeated calls cost a
+        single dict lookup.
+        """
+        handler_name = handlers.get(_figure_kind(type(figure)))
+        return getattr(self, handler_name) if handler_name is not None else None
+    
+    def _save_matplotlib(
+        self, figure: plt.Figure, target: Union[Path, io.BytesIO], format: str, quality: str
+    ) -> None:
+        """Save a Matplotlib figure."""
+        settings = _SAVE_QUALITY[quality]
+        if settings['bbox_inches'] is None:
+            # Cheaper than the extra render pass bbox_inches='tight' performs
+            figure.tight_layout()
+        
+        figure.savefig(
+            target, 
+            format=format,
+            dpi=settings['dpi'], 
+            bbox_inches=settings['bbox_inches'],
+            facecolor='white',
+            edgecolor='none'
+        )
+    
+    def _save_plotly(
+        self, figure: 'go.Figure', target: Union[Path, io.BytesIO], format: str, quality: str
+    ) -> None:
+        """Save a Plotly figure."""
+        if format.lower() == 'html':
+            if isinstance(target, io.BytesIO):
+                target.write(figure.to_html(include_plotlyjs=self.plotlyjs_source).encode('utf-8'))
+            else:
+                figure.write_html(target, include_plotlyjs=self.plotlyjs_source)
+        elif _start_kaleido_server():
+            with _kaleido_lock:
+                figure.write_image(target, format=format, width=1200, height=800)
+        else:
+            figure.write_image(target, format=format, width=1200, height=800)
+    
+    def _watermark_matplotlib(self, figure: plt.Figure, text: str) -> None:
+        """Add a watermark to a Matplotlib figure."""
+        figure.text(0.99, 0.01, text, fontsize=8, color='gray', alpha=0.5,
+                   ha='right', va='bottom', transform=figure.transFigure)
+    
+    def _watermark_plotly(self, figure: 'go.Figure', text: str) -> None:
+        """Add a watermark to a Plotly figure."""
+        figure.add_annotation(
+            text=text,
+            xref="paper", yref="paper",
+            x=0.99, y=0.01,
+            xanchor="right", yanchor="bottom",
+            font=dict(size=10, color="gray"),
+            opacity=0.5,
+            showarrow=False
+        )
     
     def create_subplot_layout(
         self, 
@@ -229,7 +579,7 @@ class BaseVisualizer(ABC):
         cols: int, 
         subplot_titles: Optional[List[str]] = None,
         engine: str = 'plotly'
-    ) -> Union[plt.Figure, go.Figure]:
+    ) -> Union[plt.Figure, 'go.Figure']:
         """Create subplot layout.
         
         Args:
@@ -242,19 +592,16 @@ class BaseVisualizer(ABC):
             Figure with subplot layout
         """
         if engine == 'matplotlib':
-            fig, axes = plt.subplots(rows, cols, figsize=(15, 10))
-            if subplot_titles:
-                for i, title in enumerate(subplot_titles):
-                    if rows == 1 and cols == 1:
-                        axes.set_title(title)
-                    elif rows == 1 or cols == 1:
-                        axes[i].set_title(title)
-                    else:
-                        row, col = divmod(i, cols)
-                        axes[row, col].set_title(title)
+            # squeeze=False always yields a 2D array, so one flat view covers
+            # single, row, column and grid layouts alike
+            fig, axes = plt.subplots(rows, cols, figsize=(15, 10), squeeze=False)
+            for ax, title in zip(axes.ravel(), subplot_titles or ()):
+                ax.set_title(title)
             return fig
         
         else:  # plotly
+            from plotly.subplots import make_subplots
+            
             fig = make_subplots(
                 rows=rows, 
                 cols=cols,
@@ -278,7 +625,10 @@ class BaseVisualizer(ABC):
                 if not data:
                     self.logger.warning("Empty data list provided")
                     return False
-                if not all(isinstance(item, ProductData) for item in data):
+                # Check if all items are ProductData instances; collecting the
+                # distinct types runs in C, so only those few need an issubclass check
+                item_types = set(map(type, data))
+                if not all(issubclass(item_type, ProductData) for item_type in item_types):
                     self.logger.error("Invalid data type in list")
                     return False
                     
@@ -293,49 +643,22 @@ class BaseVisualizer(ABC):
                     return False
                     
             else:
-                self.logger.error(f"Unsupported data type: {type(data)}")
+                self.logger.error("Unsupported data type: %s", type(data))
                 return False
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Data validation error: {e}")
+            self.logger.error("Data validation error: %s", e)
             return False
     
-    def get_chart_theme(self, theme: str = 'default') -> Dict[str, Any]:
+    def get_chart_theme(self, theme: str = 'default') -> Mapping[str, str]:
         """Get chart theme configuration.
         
         Args:
             theme: Theme name ('default', 'dark', 'minimal', 'colorful')
             
         Returns:
-            Theme configuration dictionary
+            Read-only theme configuration mapping
         """
-        themes = {
-            'default': {
-                'background_color': 'white',
-                'grid_color': '#f0f0f0',
-                'text_color': '#333333',
-                'font_family': 'Arial, sans-serif'
-            },
-            'dark': {
-                'background_color': '#2e2e2e',
-                'grid_color': '#444444',
-                'text_color': '#ffffff',
-                'font_family': 'Arial, sans-serif'
-            },
-            'minimal': {
-                'background_color': 'white',
-                'grid_color': '#e0e0e0',
-                'text_color': '#666666',
-                'font_family': 'Helvetica, sans-serif'
-            },
-            'colorful': {
-                'background_color': '#f8f9fa',
-                'grid_color': '#dee2e6',
-                'text_color': '#212529',
-                'font_family': 'Roboto, sans-serif'
-            }
-        }
-        
-        return themes.get(theme, themes['default'])
\ No newline at end of file
+        return _CHART_THEMES.get(theme, _CHART_THEMES['default'])
@@ -7,16 +7,69 @@ import seaborn as sns
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Union, Optional, Tuple
 
 from .base_visualizer import BaseVisualizer
 from ..collectors.base_collector import ProductData
 from ..utils.helpers import format_currency
 
+# A dashboard subplot: its traces plus x and y axis update settings
+SubplotParts = Tuple[List[Any], Dict[str, Any], Dict[str, Any]]
+
+
+def _downsample_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """Pick indices that keep the shape of a long series within max_points.
+    
+    The series is split into equal buckets and the minimum and maximum of
+    each bucket are kept (min/max decimation), along with the first and last
+    points, so peaks and dips survive the reduction.
+    
+    Args:
+        values: Series values in plotting order
+        max_points: Maximum number of points to keep
+        
+    Returns:
+        Sorted indices into values
+    """
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n)
+    
+    # Round the bucket size up so every point falls in a bucket; the last
+    # bucket is padded with the final value, which maps back to index n - 1
+    bucket_size = -(-n // max(1, (max_points - 2) // 2))
+    n_buckets = -(-n // bucket_size)
+    padded = np.concatenate((values, np.repeat(values[-1:], n_buckets * bucket_size - n)))
+    buckets = padded.reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    
+    indices = np.concatenate((
+        [0, n - 1],
+        offsets + buckets.argmin(axis=1),
+        offsets + buckets.argmax(axis=1)
+    ))
+    return np.unique(np.minimum(indices, n - 1))
+
 
 class PriceVisualizer(BaseVisualizer):
     """Main price visualizer with 6 different chart types."""
     
+    # Longest trend trace sent to the browser; longer histories are decimated
+    max_trend_points = 2000
+    
+    # Scatter charts with more points than this are drawn as a 2-D density
+    max_scatter_points = 20000
+    scatter_density_bins = 200
+    
+    # Heatmaps of frames with more numeric columns than this keep the price
+    # columns below plus the highest-variance remaining columns
+    max_correlation_columns = 10
+    correlation_columns = ('price', 'rating', 'review_count')
+    
+    # Caller frame columns downcast to float32 before charting; price keeps
+    # float64 so large prices keep their cents
+    float32_columns = ('rating', 'review_count')
+    
     def __init__(self):
         """Initialize the price visualizer."""
         super().__init__()
@@ -47,15 +100,10 @@ class PriceVisualizer(BaseVisualizer):
         Returns:
             Chart figure
         """
-        if not self.validate_data(data):
+        df = self._get_dataframe(data)
+        if df is None:
             raise ValueError("Invalid data provided for visualization")
         
-        # Convert to DataFrame if needed
-        if isinstance(data, list):
-            df = self.prepare_dataframe(data)
-        else:
-            df = data.copy()
-        
         if chart_type not in self.chart_types:
             raise ValueError(f"Unsupported chart type: {chart_type}")
         
@@ -75,15 +123,10 @@ class PriceVisualizer(BaseVisualizer):
         Returns:
             Plotly dashboard figure
         """
-        if not self.validate_data(data):
+        df = self._get_dataframe(data)
+        if df is None:
             raise ValueError("Invalid data provided for dashboard")
         
-        # Convert to DataFrame if needed
-        if isinstance(data, list):
-            df = self.prepare_dataframe(data)
-        else:
-            df = data.copy()
-        
         # Create subplot layout (2x3 grid)
         fig = make_subplots(
             rows=3, cols=2,
@@ -96,8 +139,8 @@ class PriceVisualizer(BaseVisualizer):
                 'Price Correlation Heatmap'
             ],
             specs=[
-                [{"type": "histogram"}, {"type": "bar"}],
-                [{"type": "scatter"}, {"type": "box"}],
+                [{"type": "bar"}, {"type": "bar"}],
+                [{"type": "scattergl"}, {"type": "box"}],
                 [{"type": "scatter"}, {"type": "heatmap"}]
             ],
             vertical_spacing=0.12,
@@ -105,26 +148,31 @@ class PriceVisualizer(BaseVisualizer):
         )
         
         try:
-            # 1. Price Distribution (Histogram)
-            self._add_distribution_subplot(fig, df, row=1, col=1)
-            
-            # 2. Platform Comparison (Bar Chart)
-            self._add_platform_comparison_subplot(fig, df, row=1, col=2)
-            
-            # 3. Scatter Plot (Price vs Rating)
-            self._add_scatter_subplot(fig, df, row=2, col=1)
+            # Rows with a positive price, filtered once and shared by the
+            # distribution, scatter and box plot subplots
+            valid_df = df.loc[df['price'].to_numpy() > 0]
             
-            # 4. Box Plot (Price Ranges by Platform)
-            self._add_box_plot_subplot(fig, df, row=2, col=2)
+            # (row, col) -> subplot builder and its input
+            subplots = {
+                (1, 1): (self._distribution_subplot, valid_df['price']),
+                (1, 2): (self._platform_comparison_subplot, df),
+                (2, 1): (self._scatter_subplot, valid_df),
+                (2, 2): (self._box_plot_subplot, valid_df),
+                (3, 1): (self._trend_subplot, df),
+                (3, 2): (self._heatmap_subplot, df)
+            }
             
-            # 5. Price Trend (Line Chart)
-            self._add_trend_subplot(fig, df, row=3, col=1)
-            
-            # 6. Correlation Heatmap
-            self._add_heatmap_subplot(fig, df, row=3, col=2)
+            for (row, col), (build, subplot_data) in subplots.items():
+                traces, xaxis_settings, yaxis_settings = build(subplot_data)
+                for trace in traces:
+                    fig.add_trace(trace, row=row, col=col)
+                if xaxis_settings:
+                    fig.update_xaxes(row=row, col=col, **xaxis_settings)
+                if yaxis_settings:
+                    fig.update_yaxes(row=row, col=col, **yaxis_settings)
             
         except Exception as e:
-            self.logger.error(f"Error creating dashboard: {e}")
+            self.logger.error("Error creating dashboard: %s", e)
             # Create a simple fallback chart
             return self._create_fallback_chart(df)
         
@@ -144,18 +192,50 @@ class PriceVisualizer(BaseVisualizer):
         self.add_watermark(fig)
         return fig
     
+    def _get_dataframe(self, data: Union[List[ProductData], pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """Get the DataFrame to chart, validating and preparing data only when needed.
+        
+        A non-empty DataFrame skips validation: chart builders never modify
+        df in place and check for the columns they need themselves. Its
+        float64 float32_columns (rating and review_count) are downcast to
+        float32. Price deliberately stays float64, since float32 drops cents
+        above about 131k. Other columns are shared, not copied. A product
+        list is validated and prepared on every call, so charts always
+        reflect its current contents.
+        
+        Returns:
+            DataFrame to chart, or None if data is not valid chart input
+        """
+        if isinstance(data, pd.DataFrame) and not data.empty:
+            downcast = {
+                column: np.float32 for column in self.float32_columns
+                if column in data.columns and data[column].dtype == np.float64
+            }
+            return data.astype(downcast, copy=False) if downcast else data
+        
+        if not self.validate_data(data):
+            return None
+        if not isinstance(data, list):
+            return data
+        return self.prepare_dataframe(data)
+    
     def _create_price_distribution_chart(self, df: pd.DataFrame, **kwargs) -> go.Figure:
         """Chart Type 1: Price Distribution Histogram."""
         engine = kwargs.get('engine', 'plotly')
         
-        valid_prices = df[df['price'] > 0]['price']
+        # Filter the price column alone rather than the whole frame, and
+        # compute the summary lines once for either engine
+        prices = df['price']
+        valid_prices = prices[prices > 0]
+        mean_price = valid_prices.mean()
+        median_price = valid_prices.median()
         
         if engine == 'plotly':
             fig = go.Figure()
             
-            fig.add_trace(go.Histogram(
-                x=valid_prices,
-                nbinsx=30,
+            fig.add_trace(self._histogram_bar(
+                valid_prices,
+                bins=30,
                 name='Price Distribution',
                 marker_color='#3b82f6',
                 opacity=0.7
@@ -169,9 +249,6 @@ class PriceVisualizer(BaseVisualizer):
             )
             
             # Add statistics annotations
-            mean_price = valid_prices.mean()
-            median_price = valid_prices.median()
-            
             fig.add_vline(x=mean_price, line_dash="dash", line_color="red", 
                          annotation_text=f"Mean: {self.format_currency(mean_price)}")
             fig.add_vline(x=median_price, line_dash="dash", line_color="green", 
@@ -183,8 +260,8 @@ class PriceVisualizer(BaseVisualizer):
             fig, ax = plt.subplots(figsize=(12, 8))
             
             ax.hist(valid_prices, bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-            ax.axvline(valid_prices.mean(), color='red', linestyle='--', label=f'Mean: {self.format_currency(valid_prices.mean())}')
-            ax.axvline(valid_prices.median(), color='green', linestyle='--', label=f'Median: {self.format_currency(valid_prices.median())}')
+            ax.axvline(mean_price, color='red', linestyle='--', label=f'Mean: {self.format_currency(mean_price)}')
+            ax.axvline(median_price, color='green', linestyle='--', label=f'Median: {self.format_currency(median_price)}')
             
             ax.set_title('Price Distribution Analysis', fontsize=16)
             ax.set_xlabel('Price ($)')
@@ -199,32 +276,47 @@ class PriceVisualizer(BaseVisualizer):
         if 'platform' not in df.columns:
             return self._create_fallback_chart(df, "Platform column not found")
         
-        platform_stats = df.groupby('platform').agg({
-            'price': ['mean', 'median', 'count']
-        }).round(2)
-        
-        platform_stats.columns = ['avg_price', 'median_price', 'product_count']
-        platform_stats = platform_stats.reset_index()
+        # Named aggregation on the price column alone: one grouping pass, no
+        # MultiIndex columns to flatten afterwards. Values are left unrounded;
+        # the bar labels are rounded when formatted
+        platform_stats = df.groupby('platform', sort=False, observed=True)['price'].agg(
+            avg_price='mean',
+            median_price='median',
+            product_count='count'
+        ).reset_index()
+        
+        # Hand Plotly plain arrays rather than Series
+        platforms = platform_stats['platform'].to_numpy()
+        avg_prices = platform_stats['avg_price'].to_numpy()
+        median_prices = platform_stats['median_price'].to_numpy()
+        
+        # Label both bar series in one vectorized pass; averages and medians
+        # often coincide, and format_currency_series formats each distinct
+        # amount only once
+        labels = self.format_currency_series(
+            pd.Series(np.concatenate((avg_prices, median_prices)))
+        ).to_numpy()
+        avg_labels, median_labels = np.split(labels, 2)
         
         fig = go.Figure()
         
         # Average price bars
         fig.add_trace(go.Bar(
-            x=platform_stats['platform'],
-            y=platform_stats['avg_price'],
+            x=platforms,
+            y=avg_prices,
             name='Average Price',
             marker_color='#3b82f6',
-            text=[self.format_currency(price) for price in platform_stats['avg_price']],
+            text=avg_labels,
             textposition='auto'
         ))
         
         # Median price bars
         fig.add_trace(go.Bar(
-            x=platform_stats['platform'],
-            y=platform_stats['median_price'],
+            x=platforms,
+            y=median_prices,
             name='Median Price',
             marker_color='#10b981',
-            text=[self.format_currency(price) for price in platform_stats['median_price']],
+            text=median_labels,
             textposition='auto'
         ))
         
@@ -238,41 +330,58 @@ class PriceVisualizer(BaseVisualizer):
         return fig
     
     def _create_price_trend_chart(self, df: pd.DataFrame, **kwargs) -> go.Figure:
-        """Chart Type 3: Price Trend Over Time."""
+        """Chart Type 3: Price Trend Over Time.
+        
+        Traces longer than max_trend_points are decimated before plotting.
+        """
         if 'timestamp' not in df.columns:
             return self._create_fallback_chart(df, "Timestamp column not found")
         
-        # Aggregate by date
-        df_trend = df.groupby([df['timestamp'].dt.date, 'platform'])['price'].mean().reset_index()
-        df_trend['timestamp'] = pd.to_datetime(df_trend['timestamp'])
-        
-        fig = go.Figure()
-        
-        colors = self.get_color_palette('primary', df['platform'].nunique())
-        
-        for i, platform in enumerate(df['platform'].unique()):
-            platform_data = df_trend[df_trend['platform'] == platform]
-            
-            fig.add_trace(go.Scatter(
-                x=platform_data['timestamp'],
-                y=platform_data['price'],
-                mode='lines+markers',
-                name=platform,
-                line=dict(color=colors[i % len(colors)], width=2),
-                marker=dict(size=6)
-            ))
+        # Aggregate by day; normalize() keeps the key as datetime64 instead of
+        # building a Python date object per row. Days stay sorted for the lines
+        df_trend = df.groupby(
+            [df['timestamp'].dt.normalize(), 'platform'], observed=True
+        )['price'].mean().reset_index()
+        
+        # Decimate long platform histories; positions are taken per platform
+        # so every line keeps its own peaks and dips
+        if len(df_trend) > self.max_trend_points:
+            prices = df_trend['price'].to_numpy()
+            platform_rows = df_trend.groupby('platform', sort=False, observed=True).indices.values()
+            keep = np.concatenate([
+                rows[_downsample_indices(prices[rows], self.max_trend_points)]
+                for rows in platform_rows
+            ])
+            df_trend = df_trend.iloc[np.sort(keep)]
+        
+        # One px.line call splits the frame into a trace per platform
+        fig = px.line(
+            df_trend,
+            x='timestamp',
+            y='price',
+            color='platform',
+            color_discrete_sequence=self.get_color_palette('primary', df_trend['platform'].nunique()),
+            markers=True
+        )
+        fig.update_traces(line_width=2, marker_size=6)
         
         fig.update_layout(
             title='Price Trends Over Time',
             xaxis_title='Date',
             yaxis_title='Average Price ($)',
+            legend_title_text='Platform',
             hovermode='x unified'
         )
         
         return fig
     
     def _create_scatter_analysis_chart(self, df: pd.DataFrame, **kwargs) -> go.Figure:
-        """Chart Type 4: Scatter Plot Analysis (Price vs Rating)."""
+        """Chart Type 4: Scatter Plot Analysis (Price vs Rating).
+        
+        Drawn with WebGL traces so large product sets stay interactive. Past
+        max_scatter_points the points are binned server-side into a density
+        heatmap, so the payload no longer grows with the number of products.
+        """
         if 'rating' not in df.columns:
             # Use price vs review_count if rating not available
             if 'review_count' not in df.columns:
@@ -284,7 +393,22 @@ class PriceVisualizer(BaseVisualizer):
         valid_data = df.dropna(subset=[x_col, 'price'])
         valid_data = valid_data[valid_data['price'] > 0]
         
-        if 'platform' in df.columns:
+        if len(valid_data) > self.max_scatter_points:
+            counts, x_edges, y_edges = np.histogram2d(
+                valid_data[x_col].to_numpy(dtype=np.float64),
+                valid_data['price'].to_numpy(dtype=np.float64),
+                bins=self.scatter_density_bins
+            )
+            fig = go.Figure(go.Heatmap(
+                z=counts.T,
+                x=(x_edges[:-1] + x_edges[1:]) / 2,
+                y=(y_edges[:-1] + y_edges[1:]) / 2,
+                colorscale='Blues',
+                colorbar=dict(title='Products'),
+                hovertemplate=f'{x_title}: %{{x:.2f}}<br>Price: $%{{y:.2f}}<br>Products: %{{z}}<extra></extra>'
+            ))
+            fig.update_layout(title=f'Price vs {x_title} Analysis')
+        elif 'platform' in df.columns:
             fig = px.scatter(
                 valid_data,
                 x=x_col,
@@ -292,16 +416,17 @@ class PriceVisualizer(BaseVisualizer):
                 color='platform',
                 size='price',
                 hover_data=['name', 'platform'],
-                title=f'Price vs {x_title} Analysis'
+                title=f'Price vs {x_title} Analysis',
+                render_mode='webgl'
             )
         else:
             fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=valid_data[x_col],
-                y=valid_data['price'],
+            fig.add_trace(go.Scattergl(
+                x=valid_data[x_col].to_numpy(),
+                y=valid_data['price'].to_numpy(),
                 mode='markers',
                 marker=dict(size=8, color='#3b82f6', opacity=0.6),
-                text=valid_data['name'],
+                text=valid_data['name'].to_numpy(),
                 hovertemplate=f'{x_title}: %{{x}}<br>Price: $%{{y:.2f}}<br>%{{text}}<extra></extra>'
             ))
             
@@ -309,24 +434,21 @@ class PriceVisualizer(BaseVisualizer):
         
         fig.update_xaxes(title=x_title)
         fig.update_yaxes(title='Price ($)')
+        fig.update_layout(hovermode='closest')
         
         return fig
     
     def _create_correlation_heatmap(self, df: pd.DataFrame, **kwargs) -> go.Figure:
         """Chart Type 5: Correlation Heatmap."""
-        # Select only numeric columns
-        numeric_df = df.select_dtypes(include=[np.number])
+        corr_matrix = self._correlation_matrix(df)
         
-        if numeric_df.empty or len(numeric_df.columns) < 2:
+        if corr_matrix is None:
             return self._create_fallback_chart(df, "Insufficient numeric data for correlation")
         
-        # Calculate correlation matrix
-        corr_matrix = numeric_df.corr()
-        
         fig = go.Figure(data=go.Heatmap(
-            z=corr_matrix.values,
-            x=corr_matrix.columns,
-            y=corr_matrix.columns,
+            z=corr_matrix.to_numpy(),
+            x=corr_matrix.columns.to_numpy(),
+            y=corr_matrix.columns.to_numpy(),
             colorscale='RdBu',
             zmid=0,
             text=corr_matrix.values.round(2),
@@ -350,17 +472,16 @@ class PriceVisualizer(BaseVisualizer):
         
         fig = go.Figure()
         
-        colors = self.get_color_palette('primary', df['platform'].nunique())
+        # One hash partition of the valid prices instead of a mask per platform
+        platform_prices = df.loc[df['price'] > 0].groupby('platform', sort=False, observed=True)['price']
+        colors = self.get_color_palette('primary', platform_prices.ngroups)
         
-        for i, platform in enumerate(df['platform'].unique()):
-            platform_prices = df[df['platform'] == platform]['price']
-            valid_prices = platform_prices[platform_prices > 0]
-            
+        for (platform, valid_prices), color in zip(platform_prices, colors):
             fig.add_trace(go.Box(
-                y=valid_prices,
+                y=valid_prices.to_numpy(),
                 name=platform,
                 boxpoints='outliers',
-                marker_color=colors[i % len(colors)]
+                marker_color=color
             ))
         
         fig.update_layout(
@@ -371,116 +492,139 @@ class PriceVisualizer(BaseVisualizer):
         
         return fig
     
-    # Helper methods for dashboard subplots
-    def _add_distribution_subplot(self, fig: go.Figure, df: pd.DataFrame, row: int, col: int):
-        """Add price distribution to subplot."""
-        valid_prices = df[df['price'] > 0]['price']
-        
-        fig.add_trace(
-            go.Histogram(x=valid_prices, nbinsx=20, marker_color='#3b82f6', opacity=0.7),
-            row=row, col=col
-        )
+    def _correlation_matrix(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Correlate the numeric columns of df.
         
-        fig.update_xaxes(title_text="Price ($)", row=row, col=col)
-        fig.update_yaxes(title_text="Count", row=row, col=col)
-    
-    def _add_platform_comparison_subplot(self, fig: go.Figure, df: pd.DataFrame, row: int, col: int):
-        """Add platform comparison to subplot."""
-        if 'platform' not in df.columns:
-            return
+        Frames wider than max_correlation_columns are cut down to that many
+        columns, keeping the O(k²·N) cost and the heatmap size bounded.
+        Complete data is correlated in one np.corrcoef call on a float32
+        matrix; columns with missing values fall back to pandas, which uses
+        pairwise-complete observations.
         
-        platform_avg = df.groupby('platform')['price'].mean()
+        Returns:
+            Correlation matrix, or None if fewer than two columns qualify
+        """
+        numeric_df = df.select_dtypes(include=[np.number])
+        columns = list(numeric_df.columns)
+        if len(columns) > self.max_correlation_columns:
+            preferred = [column for column in self.correlation_columns if column in columns]
+            others = numeric_df.drop(columns=preferred).var().nlargest(
+                self.max_correlation_columns - len(preferred)
+            ).index
+            keep = set(preferred).union(others)
+            columns = [column for column in columns if column in keep]
+        if len(columns) < 2:
+            return None
+        
+        values = df[columns].to_numpy(dtype=np.float32, na_value=np.nan)
+        if len(values) < 2 or np.isnan(values).any():
+            return df[columns].corr()
+        
+        # Constant columns correlate as NaN, as with DataFrame.corr
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.corrcoef(values, rowvar=False)
+        return pd.DataFrame(corr, index=columns, columns=columns)
+    
+    def _histogram_bar(self, values: pd.Series, bins: int, **kwargs) -> go.Bar:
+        """Bin values server-side and return them as a histogram-style bar trace.
         
-        fig.add_trace(
-            go.Bar(x=platform_avg.index, y=platform_avg.values, marker_color='#10b981'),
-            row=row, col=col
+        Only the bin counts are sent to the browser, so the payload does not
+        grow with the number of products.
+        """
+        counts, edges = np.histogram(values.to_numpy(), bins=bins)
+        return go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            **kwargs
         )
-        
-        fig.update_xaxes(title_text="Platform", row=row, col=col)
-        fig.update_yaxes(title_text="Avg Price ($)", row=row, col=col)
     
-    def _add_scatter_subplot(self, fig: go.Figure, df: pd.DataFrame, row: int, col: int):
-        """Add scatter plot to subplot."""
-        if 'rating' in df.columns:
-            valid_data = df.dropna(subset=['rating', 'price'])
-            valid_data = valid_data[valid_data['price'] > 0]
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=valid_data['rating'], 
-                    y=valid_data['price'],
-                    mode='markers',
-                    marker=dict(size=4, opacity=0.6, color='#f59e0b')
-                ),
-                row=row, col=col
-            )
-            
-            fig.update_xaxes(title_text="Rating", row=row, col=col)
-            fig.update_yaxes(title_text="Price ($)", row=row, col=col)
+    # Builders for dashboard subplots. Each returns the subplot's traces and
+    # its x/y axis settings without touching the figure, which
+    # create_dashboard then applies
+    def _distribution_subplot(self, valid_prices: pd.Series) -> SubplotParts:
+        """Build the price distribution of the positive prices."""
+        traces = [self._histogram_bar(valid_prices, bins=20, marker_color='#3b82f6', opacity=0.7)]
+        return traces, {'title_text': "Price ($)"}, {'title_text': "Count"}
     
-    def _add_box_plot_subplot(self, fig: go.Figure, df: pd.DataFrame, row: int, col: int):
-        """Add box plot to subplot."""
+    def _platform_comparison_subplot(self, df: pd.DataFrame) -> SubplotParts:
+        """Build the platform comparison."""
         if 'platform' not in df.columns:
-            return
+            return [], {}, {}
         
-        colors = self.get_color_palette('primary', df['platform'].nunique())
+        platform_avg = df.groupby('platform', sort=False, observed=True)['price'].mean()
         
-        for i, platform in enumerate(df['platform'].unique()):
-            platform_prices = df[df['platform'] == platform]['price']
-            valid_prices = platform_prices[platform_prices > 0]
-            
-            fig.add_trace(
-                go.Box(
-                    y=valid_prices,
-                    name=platform,
-                    marker_color=colors[i % len(colors)],
-                    showlegend=False
-                ),
-                row=row, col=col
-            )
+        traces = [go.Bar(x=platform_avg.index.to_numpy(), y=platform_avg.to_numpy(), marker_color='#10b981')]
+        return traces, {'title_text': "Platform"}, {'title_text': "Avg Price ($)"}
+    
+    def _scatter_subplot(self, valid_df: pd.DataFrame) -> SubplotParts:
+        """Build the scatter plot of the rows with a positive price."""
+        if 'rating' not in valid_df.columns:
+            return [], {}, {}
+        
+        valid_data = valid_df.dropna(subset=['rating'])
+        
+        traces = [go.Scattergl(
+            x=valid_data['rating'].to_numpy(),
+            y=valid_data['price'].to_numpy(),
+            mode='markers',
+            marker=dict(size=4, opacity=0.6, color='#f59e0b')
+        )]
+        return traces, {'title_text': "Rating"}, {'title_text': "Price ($)"}
+    
+    def _box_plot_subplot(self, valid_df: pd.DataFrame) -> SubplotParts:
+        """Build the box plot of the rows with a positive price."""
+        if 'platform' not in valid_df.columns:
+            return [], {}, {}
+        
+        platform_prices = valid_df.groupby('platform', sort=False, observed=True)['price']
+        colors = self.get_color_palette('primary', platform_prices.ngroups)
         
-        fig.update_yaxes(title_text="Price ($)", row=row, col=col)
+        traces = [
+            go.Box(
+                y=valid_prices.to_numpy(),
+                name=platform,
+                marker_color=color,
+                showlegend=False
+            )
+            for (platform, valid_prices), color in zip(platform_prices, colors)
+        ]
+        return traces, {}, {'title_text': "Price ($)"}
     
-    def _add_trend_subplot(self, fig: go.Figure, df: pd.DataFrame, row: int, col: int):
-        """Add trend line to subplot."""
+    def _trend_subplot(self, df: pd.DataFrame) -> SubplotParts:
+        """Build the daily average price trend line."""
         if 'timestamp' not in df.columns:
-            return
-        
-        # Simple daily average
-        daily_avg = df.groupby(df['timestamp'].dt.date)['price'].mean()
-        
-        fig.add_trace(
-            go.Scatter(
-                x=daily_avg.index,
-                y=daily_avg.values,
-                mode='lines+markers',
-                line=dict(color='#8b5cf6', width=2),
-                marker=dict(size=3)
-            ),
-            row=row, col=col
-        )
-        
-        fig.update_xaxes(title_text="Date", row=row, col=col)
-        fig.update_yaxes(title_text="Avg Price ($)", row=row, col=col)
+            return [], {}, {}
+        
+        daily_avg = df.groupby(df['timestamp'].dt.normalize(), observed=True)['price'].mean()
+        if len(daily_avg) > self.max_trend_points:
+            daily_avg = daily_avg.iloc[_downsample_indices(daily_avg.to_numpy(), self.max_trend_points)]
+        
+        traces = [go.Scatter(
+            x=daily_avg.index.to_numpy(),
+            y=daily_avg.to_numpy(),
+            mode='lines+markers',
+            line=dict(color='#8b5cf6', width=2),
+            marker=dict(size=3)
+        )]
+        return traces, {'title_text': "Date"}, {'title_text': "Avg Price ($)"}
     
-    def _add_heatmap_subplot(self, fig: go.Figure, df: pd.DataFrame, row: int, col: int):
-        """Add correlation heatmap to subplot."""
-        numeric_df = df.select_dtypes(include=[np.number])
+    def _heatmap_subplot(self, df: pd.DataFrame) -> SubplotParts:
+        """Build the correlation heatmap."""
+        corr_matrix = self._correlation_matrix(df)
         
-        if len(numeric_df.columns) >= 2:
-            corr_matrix = numeric_df.corr()
-            
-            fig.add_trace(
-                go.Heatmap(
-                    z=corr_matrix.values,
-                    x=corr_matrix.columns,
-                    y=corr_matrix.columns,
-                    colorscale='RdBu',
-                    zmid=0,
-                    showscale=False
-                ),
-                row=row, col=col
-            )
+        if corr_matrix is None:
+            return [], {}, {}
+        
+        traces = [go.Heatmap(
+            z=corr_matrix.to_numpy(),
+            x=corr_matrix.columns.to_numpy(),
+            y=corr_matrix.columns.to_numpy(),
+            colorscale='RdBu',
+            zmid=0,
+            showscale=False
+        )]
+        return traces, {}, {}
     
     def _create_fallback_chart(self, df: pd.DataFrame, message: str = "Data visualization not available") -> go.Figure:
         """Create a simple fallback chart when main chart fails."""
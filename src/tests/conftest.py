@@ -0,0 +1,24 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from ecommerce_price_monitor.collectors.base_collector import ProductData
+
+
+@pytest.fixture
+def make_product():
+    """Factory for ProductData with defaults; tests override only what they check."""
+    def _make(**overrides):
+        fields = dict(
+            platform="Amazon",
+            product_id="B123",
+            name="Test Product",
+            price=99.99,
+            currency="USD",
+            availability="Available",
+            url="https://amazon.com/dp/B123"
+        )
+        fields.update(overrides)
+        return ProductData(**fields)
+
+    return _make
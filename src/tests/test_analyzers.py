@@ -3,16 +3,39 @@
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 from ecommerce_price_monitor.analyzers.base_analyzer import BaseAnalyzer, AnalysisResult
 from ecommerce_price_monitor.analyzers.price_analyzer import PriceAnalyzer
 from ecommerce_price_monitor.analyzers.statistical_analyzer import StatisticalAnalyzer
-from ecommerce_price_monitor.collectors.base_collector import ProductData
+from ecommerce_price_monitor.analyzers.comparison_analyzer import ComparisonAnalyzer
 from ecommerce_price_monitor.utils.exceptions import AnalyzerError
 
 
+# Read the clock once; tests that only need "a recent timestamp" share it
+_NOW = pd.Timestamp.now()
+
+
+class _NoopAnalyzer(BaseAnalyzer):
+    """Minimal concrete analyzer for exercising BaseAnalyzer helpers."""
+    
+    def analyze(self, data, **kwargs):
+        return AnalysisResult("test", {})
+
+
+@pytest.fixture(scope="module")
+def noop_analyzer():
+    """Shared no-op analyzer; BaseAnalyzer helpers keep no per-call state."""
+    return _NoopAnalyzer()
+
+
+@pytest.fixture
+def rng():
+    """Freshly seeded generator, so each test's data is independent of test order."""
+    return np.random.default_rng(42)
+
+
 class TestAnalysisResult:
     """Test AnalysisResult class."""
     
@@ -46,111 +69,57 @@ class TestAnalysisResult:
 class TestBaseAnalyzer:
     """Test BaseAnalyzer class."""
     
-    def test_prepare_dataframe_empty_list(self):
+    def test_prepare_dataframe_empty_list(self, noop_analyzer):
         """Test preparing DataFrame from empty list."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
-        
-        analyzer = TestAnalyzer()
-        df = analyzer.prepare_dataframe([])
+        df = noop_analyzer.prepare_dataframe([])
         
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 0
     
-    def test_prepare_dataframe_with_products(self):
+    def test_prepare_dataframe_with_products(self, noop_analyzer, make_product):
         """Test preparing DataFrame from product list."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
-        
-        analyzer = TestAnalyzer()
-        
-        products = [
-            ProductData(
-                platform="Amazon",
-                product_id="B123",
-                name="Test Product",
-                price=99.99,
-                currency="USD",
-                availability="Available",
-                url="https://amazon.com/dp/B123",
-                rating=4.5
-            )
-        ]
+        products = [make_product(rating=4.5)]
         
-        df = analyzer.prepare_dataframe(products)
+        df = noop_analyzer.prepare_dataframe(products)
         
         assert len(df) == 1
         assert df.iloc[0]['platform'] == "Amazon"
         assert df.iloc[0]['price'] == 99.99
         assert df.iloc[0]['rating'] == 4.5
     
-    def test_validate_data_valid_list(self):
+    def test_validate_data_valid_list(self, noop_analyzer, make_product):
         """Test data validation with valid product list."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
-        
-        analyzer = TestAnalyzer()
-        
-        products = [
-            ProductData(
-                platform="Amazon",
-                product_id="B123", 
-                name="Test Product",
-                price=99.99,
-                currency="USD",
-                availability="Available",
-                url="https://amazon.com/dp/B123"
-            )
-        ]
+        products = [make_product()]
         
-        assert analyzer.validate_data(products) is True
+        assert noop_analyzer.validate_data(products) is True
     
-    def test_validate_data_empty_list(self):
+    def test_validate_data_empty_list(self, noop_analyzer):
         """Test data validation with empty list."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
-        
-        analyzer = TestAnalyzer()
-        assert analyzer.validate_data([]) is False
+        assert noop_analyzer.validate_data([]) is False
     
-    def test_validate_data_valid_dataframe(self):
+    def test_validate_data_valid_dataframe(self, noop_analyzer):
         """Test data validation with valid DataFrame."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
-        
-        analyzer = TestAnalyzer()
-        
         df = pd.DataFrame({
             'price': [99.99, 89.99],
-            'timestamp': [datetime.now(), datetime.now()]
+            'timestamp': _NOW
         })
         
-        assert analyzer.validate_data(df) is True
+        assert noop_analyzer.validate_data(df) is True
     
-    def test_validate_data_empty_dataframe(self):
-        """Test data validation with empty DataFrame."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
+    def test_validate_data_missing_timestamp(self, noop_analyzer):
+        """Test DataFrames without a timestamp column are rejected."""
+        df = pd.DataFrame({'price': [99.99, 89.99]})
         
-        analyzer = TestAnalyzer()
+        assert noop_analyzer.validate_data(df) is False
+    
+    def test_validate_data_empty_dataframe(self, noop_analyzer):
+        """Test data validation with empty DataFrame."""
         df = pd.DataFrame()
         
-        assert analyzer.validate_data(df) is False
+        assert noop_analyzer.validate_data(df) is False
     
-    def test_filter_by_date_range(self):
+    def test_filter_by_date_range(self, noop_analyzer):
         """Test filtering DataFrame by date range."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
-        
-        analyzer = TestAnalyzer()
-        
         # Create test data with different dates
         dates = [
             datetime(2024, 1, 1),
@@ -165,52 +134,40 @@ class TestBaseAnalyzer:
         })
         
         # Filter for January 2024
-        filtered = analyzer.filter_by_date_range(
+        filtered = noop_analyzer.filter_by_date_range(
             df, 
             start_date=datetime(2024, 1, 1),
             end_date=datetime(2024, 1, 31)
         )
         
         assert len(filtered) == 2
-        assert all(filtered['timestamp'].dt.month == 1)
+        assert (filtered['timestamp'].dt.month == 1).all()
     
-    def test_filter_by_platform(self):
+    def test_filter_by_platform(self, noop_analyzer):
         """Test filtering DataFrame by platforms."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
-        
-        analyzer = TestAnalyzer()
-        
         df = pd.DataFrame({
             'platform': ['Amazon', 'eBay', 'Amazon', 'Walmart'],
             'price': [100, 90, 105, 95]
         })
         
-        filtered = analyzer.filter_by_platform(df, ['Amazon', 'eBay'])
+        filtered = noop_analyzer.filter_by_platform(df, ['Amazon', 'eBay'])
         
         assert len(filtered) == 3
-        assert all(filtered['platform'].isin(['Amazon', 'eBay']))
+        assert filtered['platform'].isin(['Amazon', 'eBay']).all()
     
-    def test_calculate_basic_stats(self):
+    def test_calculate_basic_stats(self, noop_analyzer):
         """Test calculating basic statistics."""
-        class TestAnalyzer(BaseAnalyzer):
-            def analyze(self, data, **kwargs):
-                return AnalysisResult("test", {})
-        
-        analyzer = TestAnalyzer()
-        
         df = pd.DataFrame({
             'price': [100, 110, 120, 130, 140],
             'rating': [4.0, 4.5, 5.0, 3.5, 4.2]
         })
         
-        stats = analyzer.calculate_basic_stats(df)
+        stats = noop_analyzer.calculate_basic_stats(df)
         
         assert 'price' in stats
         assert 'rating' in stats
         assert stats['price']['count'] == 5
-        assert stats['price']['mean'] == 120.0
+        assert stats['price']['mean'] == pytest.approx(120.0)
         assert stats['price']['min'] == 100.0
         assert stats['price']['max'] == 140.0
 
@@ -236,7 +193,8 @@ class TestPriceAnalyzer:
             'name': ['Product A', 'Product B', 'Product C', 'Product D'],
             'price': [100.0, 90.0, 110.0, 85.0],
             'rating': [4.5, 4.0, 4.2, 3.8],
-            'timestamp': [datetime.now()] * 4
+            # Required by validate_data even though no trend is computed
+            'timestamp': _NOW
         })
         
         result = analyzer.analyze(df)
@@ -263,7 +221,7 @@ class TestPriceAnalyzer:
         assert overview['total_products'] == 2
         assert overview['platforms_count'] == 2
         assert 'price_stats' in overview
-        assert overview['price_stats']['average'] == 95.0
+        assert overview['price_stats']['average'] == pytest.approx(95.0)
     
     def test_analyze_platforms(self):
         """Test platform analysis."""
@@ -279,10 +237,28 @@ class TestPriceAnalyzer:
         
         assert 'Amazon' in platform_analysis
         assert 'eBay' in platform_analysis
-        assert platform_analysis['Amazon']['average_price'] == 105.0
-        assert platform_analysis['eBay']['average_price'] == 92.5
+        assert platform_analysis['Amazon']['average_price'] == pytest.approx(105.0)
+        assert platform_analysis['eBay']['average_price'] == pytest.approx(92.5)
         assert 'summary' in platform_analysis
-    
+
+    def test_analyze_platforms_ignores_unpriced_products(self):
+        """Test unpriced products count towards a platform but not its price stats."""
+        analyzer = PriceAnalyzer()
+
+        df = pd.DataFrame({
+            'platform': pd.Categorical(['eBay', 'Amazon', 'eBay', 'Walmart'], categories=['Amazon', 'eBay', 'Walmart', 'Target']),
+            'price': [0.0, 100.0, 80.0, 0.0],
+            'rating': [np.nan, 4.5, 4.0, 3.0]
+        })
+
+        platform_analysis = analyzer._analyze_platforms(df)
+
+        assert list(platform_analysis) == ['eBay', 'Amazon', 'summary']
+        assert platform_analysis['eBay']['product_count'] == 2
+        assert platform_analysis['eBay']['min_price'] == pytest.approx(80.0)
+        assert platform_analysis['eBay']['price_std'] == 0
+        assert platform_analysis['eBay']['rating_count'] == 1
+
     def test_identify_best_deals(self):
         """Test best deals identification."""
         analyzer = PriceAnalyzer()
@@ -331,8 +307,8 @@ class TestStatisticalAnalyzer:
         assert 'median' in stats
         assert 'std' in stats
         assert stats['count'] == 5
-        assert stats['mean'] == 120.0
-        assert stats['median'] == 120.0
+        assert stats['mean'] == pytest.approx(120.0)
+        assert stats['median'] == pytest.approx(120.0)
     
     def test_outlier_detection_iqr(self):
         """Test outlier detection using IQR method."""
@@ -340,7 +316,7 @@ class TestStatisticalAnalyzer:
         
         # Create data with obvious outliers
         df = pd.DataFrame({
-            'price': [10, 15, 20, 25, 30, 1000],  # 1000 is an outlier
+            'price': np.array([10, 15, 20, 25, 30, 1000], dtype=np.int64),  # 1000 is an outlier
             'name': ['P1', 'P2', 'P3', 'P4', 'P5', 'P6'],
             'platform': ['Amazon'] * 6
         })
@@ -350,19 +326,18 @@ class TestStatisticalAnalyzer:
         assert outliers['outlier_count'] >= 1
         assert 1000.0 in outliers['outlier_values']
     
-    def test_correlation_analysis(self):
+    def test_correlation_analysis(self, rng):
         """Test correlation analysis."""
         analyzer = StatisticalAnalyzer()
         
         # Create correlated data
-        np.random.seed(42)
-        price = np.random.normal(100, 20, 50)
-        rating = 5 - (price - 100) / 50 + np.random.normal(0, 0.1, 50)  # Negative correlation
+        price = rng.normal(100, 20, 50)
+        rating = 5 - (price - 100) / 50 + rng.normal(0, 0.1, 50)  # Negative correlation
         
         df = pd.DataFrame({
             'price': price,
             'rating': rating,
-            'review_count': np.random.randint(10, 1000, 50)
+            'review_count': rng.integers(10, 1000, 50)
         })
         
         corr_analysis = analyzer._analyze_correlations(df)
@@ -371,21 +346,24 @@ class TestStatisticalAnalyzer:
         assert 'strong_correlations' in corr_analysis
 
 
-@pytest.fixture
-def sample_dataframe():
-    """Sample DataFrame for testing."""
-    np.random.seed(42)
-    
+def _build_sample_dataframe(rng):
+    """Build a sample DataFrame from the given generator."""
     return pd.DataFrame({
         'platform': ['Amazon', 'eBay', 'Walmart'] * 20,
         'name': [f'Product {i}' for i in range(60)],
-        'price': np.random.normal(100, 25, 60),
-        'rating': np.random.uniform(3, 5, 60),
-        'review_count': np.random.randint(10, 1000, 60),
-        'timestamp': [datetime.now() - timedelta(days=i) for i in range(60)]
+        'price': rng.normal(100, 25, 60),
+        'rating': rng.uniform(3, 5, 60),
+        'review_count': rng.integers(10, 1000, 60),
+        'timestamp': pd.date_range(start=_NOW, periods=60, freq='-1D')
     })
 
 
+@pytest.fixture(scope="session")
+def sample_dataframe():
+    """Sample DataFrame for testing, built once; analyzers only read their input."""
+    return _build_sample_dataframe(np.random.default_rng(42))
+
+
 class TestIntegration:
     """Integration tests for analyzers."""
     
@@ -412,6 +390,16 @@ class TestIntegration:
         assert 'descriptive_stats' in result.data
         assert 'outlier_analysis' in result.data
     
+    @pytest.mark.parametrize("analyzer_class", [StatisticalAnalyzer, ComparisonAnalyzer])
+    def test_analyze_does_not_modify_input(self, analyzer_class, rng):
+        """Test analyzers leave the caller's DataFrame untouched."""
+        df = _build_sample_dataframe(rng)
+        expected = df.copy()
+        
+        analyzer_class().analyze(df)
+        
+        pd.testing.assert_frame_equal(df, expected)
+    
     def test_error_handling_invalid_data(self):
         """Test error handling with invalid data."""
         analyzer = PriceAnalyzer()
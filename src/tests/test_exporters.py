@@ -0,0 +1,81 @@
+"""Tests for data exporters."""
+
+import pytest
+import pandas as pd
+
+from ecommerce_price_monitor.exporters.data_exporter import DataExporter
+
+
+@pytest.fixture
+def sample_frame():
+    """Small product frame for export tests."""
+    return pd.DataFrame({
+        'platform': ['Amazon', 'eBay'],
+        'name': ['Product A', 'Product B'],
+        'price': [99.99, 89.99]
+    })
+
+
+class TestDataExporter:
+    """Test DataExporter class."""
+
+    def test_export_multiple_formats(self, sample_frame, tmp_path):
+        """Test every format is written and reported in input order."""
+        exporter = DataExporter()
+        formats = ['html', 'csv', 'json']
+
+        results = exporter.export_multiple_formats(
+            sample_frame, formats, 'products', str(tmp_path)
+        )
+
+        assert list(results) == formats
+        for format_name, path in results.items():
+            assert path == str(tmp_path / f"products.{format_name}")
+        assert pd.read_csv(results['csv']).equals(sample_frame)
+
+    def test_export_multiple_formats_failure_is_isolated(self, sample_frame, tmp_path):
+        """Test a failing format maps to None without affecting the others."""
+        exporter = DataExporter()
+
+        results = exporter.export_multiple_formats(
+            sample_frame, ['csv', 'pdf'], 'products', str(tmp_path)
+        )
+
+        assert results['csv'] == str(tmp_path / "products.csv")
+        assert results['pdf'] is None
+
+    def test_export_multiple_formats_empty(self, sample_frame, tmp_path):
+        """Test exporting no formats returns an empty mapping."""
+        assert DataExporter().export_multiple_formats(sample_frame, [], 'products', str(tmp_path)) == {}
+
+    def test_export_csv_matches_pandas_with_pyarrow_installed(self, tmp_path):
+        """Test the default CSV is byte-identical to to_csv even when pyarrow is installed."""
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({
+            'name': ['Product A', 'Product, B', ''],
+            'price': [99.99, 3.0, float('nan')],
+            'in_stock': [True, False, True],
+            'timestamp': pd.to_datetime(['2024-01-01 10:00:00', '2024-01-02 11:30:15', None])
+        })
+        
+        path = DataExporter().export_data(df, 'csv', 'products', str(tmp_path))
+        
+        with open(path, 'rb') as f:
+            assert f.read() == df.to_csv(index=False).encode('utf-8')
+    
+    def test_export_csv_pyarrow_engine(self, sample_frame, tmp_path):
+        """Test the opt-in pyarrow writer produces an equivalent table."""
+        pytest.importorskip("pyarrow")
+        
+        path = DataExporter().export_data(sample_frame, 'csv', 'products', str(tmp_path), csv_engine='pyarrow')
+        
+        assert pd.read_csv(path).equals(sample_frame)
+    
+    def test_export_csv_pyarrow_engine_without_pyarrow(self, sample_frame, tmp_path, monkeypatch):
+        """Test the pyarrow engine falls back to pandas when pyarrow is unavailable."""
+        monkeypatch.setattr("ecommerce_price_monitor.exporters.data_exporter.pa", None)
+        
+        path = DataExporter().export_data(sample_frame, 'csv', 'products', str(tmp_path), csv_engine='pyarrow')
+        
+        with open(path, 'rb') as f:
+            assert f.read() == sample_frame.to_csv(index=False).encode('utf-8')
@@ -0,0 +1,110 @@
+"""Tests for utility helpers."""
+
+import pytest
+import numpy as np
+
+from ecommerce_price_monitor.utils.helpers import (
+    calculate_percentage_change,
+    calculate_percentage_change_array,
+    clean_html_text,
+    generate_product_hash,
+    normalize_product_name,
+    safe_divide_array,
+    validate_url,
+)
+
+
+class TestCleanHtmlText:
+    """Test clean_html_text helper."""
+
+    def test_clean_html_text_strips_tags_and_entities(self):
+        """Test removing tags and decoding common entities."""
+        text = "<p>Tom&nbsp;&amp;&nbsp;Jerry &lt;DVD&gt; &quot;box&quot; &#39;set&#39;</p>"
+
+        assert clean_html_text(text) == "Tom & Jerry <DVD> \"box\" 'set'"
+
+    def test_clean_html_text_collapses_whitespace(self):
+        """Test collapsing whitespace left over from removed markup."""
+        assert clean_html_text("  <b>Price</b>\n\t<span>$10</span>  ") == "Price $10"
+
+    def test_clean_html_text_empty(self):
+        """Test cleaning empty input."""
+        assert clean_html_text("") == ""
+
+
+class TestGenerateProductHash:
+    """Test generate_product_hash helper."""
+
+    def test_generate_product_hash_is_stable(self):
+        """Test hash length and determinism."""
+        first = generate_product_hash("Amazon", "B123", "Test Product")
+        second = generate_product_hash("amazon", "B123", "Test Product")
+
+        assert len(first) == 16
+        assert first == second
+
+    def test_generate_product_hash_keeps_stored_digest(self):
+        """Test the digest matches hashes already stored by earlier releases."""
+        assert generate_product_hash("Amazon", "B123", "Test Product") == "faf4d91b32092257"
+
+    def test_generate_product_hash_differs_by_product(self):
+        """Test different products produce different hashes."""
+        assert generate_product_hash("Amazon", "B123", "Test") != \
+            generate_product_hash("Amazon", "B124", "Test")
+
+
+class TestArrayHelpers:
+    """Test vectorized helper variants."""
+
+    def test_calculate_percentage_change_array_matches_scalar(self):
+        """Test array results agree with the scalar helper, including zeros."""
+        old = [100.0, 50.0, 0.0, 0.0]
+        new = [110.0, 25.0, 10.0, 0.0]
+
+        result = calculate_percentage_change_array(old, new)
+        expected = [calculate_percentage_change(o, n) for o, n in zip(old, new)]
+
+        np.testing.assert_allclose(result, expected)
+
+    def test_safe_divide_array_zero_denominator(self):
+        """Test division by zero yields 0 element-wise."""
+        result = safe_divide_array([10.0, 5.0, 3.0], [2.0, 0.0, 4.0])
+
+        np.testing.assert_allclose(result, [5.0, 0.0, 0.75])
+
+
+class TestNormalizeProductName:
+    """Test normalize_product_name helper."""
+
+    def test_normalize_product_name_removes_filler_words(self):
+        """Test filler tokens are dropped and whitespace collapsed."""
+        name = "  NEW Apple   iPhone Original\tItem "
+
+        assert normalize_product_name(name) == "apple iphone"
+
+    def test_normalize_product_name_keeps_partial_matches(self):
+        """Test words that merely contain filler words are kept."""
+        assert normalize_product_name("Newer brand-new Items") == "newer brand-new items"
+
+    def test_normalize_product_name_strips_accents(self):
+        """Test combining marks are removed after decomposition."""
+        assert normalize_product_name("Café Crème Über") == "cafe creme uber"
+
+
+class TestValidateUrl:
+    """Test validate_url helper."""
+
+    @pytest.mark.parametrize("url", [
+        "https://www.amazon.com/dp/B08N5WRWNW",
+        "HTTP://example.com",
+        "ftp://files.example.com/data.csv",
+        "http://[::1]/status",
+    ])
+    def test_validate_url_valid(self, url):
+        """Test valid URLs for http(s) and other schemes."""
+        assert validate_url(url) is True
+
+    @pytest.mark.parametrize("url", ["", "not a url", "http://", "http:///path", "/relative"])
+    def test_validate_url_invalid(self, url):
+        """Test invalid URLs are rejected."""
+        assert validate_url(url) is False
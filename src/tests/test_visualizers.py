@@ -0,0 +1,243 @@
+"""Tests for data visualizers."""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+import numpy as np
+import pandas as pd
+from dataclasses import replace
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from ecommerce_price_monitor.collectors.base_collector import ProductData
+from ecommerce_price_monitor.visualizers import base_visualizer
+from ecommerce_price_monitor.visualizers.price_visualizer import PriceVisualizer, _downsample_indices
+
+
+@pytest.fixture
+def sample_frame():
+    """Small product frame covering every dashboard chart."""
+    rows = 20
+    return pd.DataFrame({
+        'platform': ['amazon', 'ebay'] * (rows // 2),
+        'name': [f'Product {i}' for i in range(rows)],
+        'price': [10.0 + i for i in range(rows)],
+        'rating': [3.5 + (i % 3) * 0.5 for i in range(rows)],
+        'review_count': list(range(rows)),
+        'timestamp': [datetime(2024, 1, 1) + timedelta(days=i % 5) for i in range(rows)]
+    })
+
+
+@pytest.fixture
+def sample_products():
+    """Small list of products across two platforms."""
+    return [
+        ProductData(
+            platform=platform,
+            product_id=f"{platform}-{i}",
+            name=f"Product {i}",
+            price=10.0 + i,
+            currency="USD",
+            availability="In Stock",
+            url=f"https://example.com/{platform}/{i}",
+            rating=4.0,
+            timestamp=datetime(2024, 1, 1) + timedelta(days=i)
+        )
+        for i in range(5)
+        for platform in ('amazon', 'ebay')
+    ]
+
+
+class TestPriceVisualizer:
+    """Test PriceVisualizer class."""
+    
+    @pytest.mark.parametrize("chart_type", list(PriceVisualizer().chart_types))
+    def test_create_chart_does_not_modify_input(self, sample_frame, chart_type):
+        """Test charts are built from the caller's frame without changing it."""
+        visualizer = PriceVisualizer()
+        original = sample_frame.copy()
+        
+        visualizer.create_chart(sample_frame, chart_type=chart_type)
+        
+        pd.testing.assert_frame_equal(sample_frame, original)
+    
+    def test_create_dashboard_does_not_modify_input(self, sample_frame):
+        """Test the dashboard is built from the caller's frame without changing it."""
+        visualizer = PriceVisualizer()
+        original = sample_frame.copy()
+        
+        fig = visualizer.create_dashboard(sample_frame)
+        
+        assert len(fig.data) == 7
+        pd.testing.assert_frame_equal(sample_frame, original)
+    
+    def test_dashboard_prepares_product_list_once(self, sample_products):
+        """Test the dashboard's subplots share one prepared DataFrame."""
+        visualizer = PriceVisualizer()
+        
+        with patch.object(visualizer, 'prepare_dataframe', wraps=visualizer.prepare_dataframe) as prepare:
+            visualizer.create_dashboard(sample_products)
+            
+            assert prepare.call_count == 1
+    
+    def test_product_list_refreshed_in_place(self, sample_products):
+        """Test a product list updated in place is charted with its new contents."""
+        visualizer = PriceVisualizer()
+        visualizer.create_chart(sample_products, chart_type='platform_comparison')
+        
+        sample_products[:] = [
+            replace(sample_products[0], platform='jd', price=500.0),
+            replace(sample_products[1], platform='taobao', price=700.0)
+        ]
+        fig = visualizer.create_chart(sample_products, chart_type='platform_comparison')
+        
+        assert list(fig.data[0].x) == ['jd', 'taobao']
+        assert list(fig.data[0].y) == pytest.approx([500.0, 700.0])
+    
+    def test_correlation_matrix_uses_all_numeric_columns(self):
+        """Test narrow frames correlate every numeric column, not only known ones."""
+        df = pd.DataFrame({
+            'price': [10.0, 20.0, 30.0, 45.0],
+            'sales': [5, 3, 4, 1],
+            'shipping': [1.0, 2.5, 2.0, 4.0],
+            'name': list('abcd')
+        })
+        
+        corr = PriceVisualizer()._correlation_matrix(df)
+        
+        assert list(corr.columns) == ['price', 'sales', 'shipping']
+    
+    def test_correlation_matrix_caps_wide_frames(self):
+        """Test wide frames keep the price columns plus the highest-variance others."""
+        visualizer = PriceVisualizer()
+        columns = {f'metric_{i}': np.arange(8.0) * i for i in range(1, 15)}
+        df = pd.DataFrame({'price': np.ones(8), 'rating': np.arange(8.0), **columns})
+        
+        corr = visualizer._correlation_matrix(df)
+        
+        assert len(corr.columns) == visualizer.max_correlation_columns
+        assert list(corr.columns[:2]) == ['price', 'rating']
+        assert 'metric_14' in corr.columns and 'metric_1' not in corr.columns
+    
+    @pytest.mark.parametrize("format", ['png', 'html'])
+    def test_save_chart_recreates_removed_output_dir(self, sample_frame, tmp_path, format):
+        """Test saving into a directory removed after an earlier save still succeeds."""
+        visualizer = PriceVisualizer()
+        output_dir = tmp_path / 'charts'
+        fig = visualizer.create_chart(sample_frame, engine='matplotlib' if format == 'png' else 'plotly')
+        
+        visualizer.save_chart(fig, 'first', format, str(output_dir), quality='preview')
+        shutil.rmtree(output_dir)
+        path = visualizer.save_chart(fig, 'second', format, str(output_dir), quality='preview')
+        
+        assert os.path.exists(path)
+    
+    def test_save_html_is_self_contained_by_default(self, sample_frame):
+        """Test HTML charts embed plotly.js unless a CDN link is opted into."""
+        visualizer = PriceVisualizer()
+        fig = visualizer.create_chart(sample_frame)
+        
+        embedded = visualizer.save_chart(fig, 'chart', 'html', None).read()
+        visualizer.plotlyjs_source = 'cdn'
+        linked = visualizer.save_chart(fig, 'chart', 'html', None).read()
+        
+        assert b'src="https://cdn.plot.ly' not in embedded
+        assert b'src="https://cdn.plot.ly' in linked
+        assert len(linked) < len(embedded)
+    
+    def test_save_charts_saves_matplotlib_serially(self, sample_frame):
+        """Test Matplotlib figures go through save_chart_batch and results keep input order."""
+        visualizer = PriceVisualizer()
+        charts = [
+            (visualizer.create_chart(sample_frame, engine='matplotlib'), 'mpl_a'),
+            (visualizer.create_chart(sample_frame), 'plotly_b'),
+            (visualizer.create_chart(sample_frame, engine='matplotlib'), 'mpl_c')
+        ]
+        
+        with patch.object(visualizer, 'save_chart_batch', side_effect=lambda figures, names, *args: list(names)) as batch, \
+                patch.object(visualizer, 'save_chart', side_effect=lambda figure, name, *args: name) as single:
+            paths = visualizer.save_charts(charts, 'png', 'unused')
+        
+        assert paths == ['mpl_a', 'plotly_b', 'mpl_c']
+        assert batch.call_count == 1
+        assert single.call_count == 1
+    
+    def test_prepare_dataframe_keeps_price_cents(self, sample_products):
+        """Test large prices keep their cents while ratings are stored as float32."""
+        products = [replace(sample_products[0], price=1234567.89)]
+        
+        df = PriceVisualizer().prepare_dataframe(products)
+        
+        assert df['price'].iloc[0] == 1234567.89
+        assert df['rating'].dtype == np.float32
+    
+    def test_scatter_sizes_markers_by_price(self, sample_frame):
+        """Test the WebGL scatter keeps per-point marker sizes from price."""
+        fig = PriceVisualizer().create_chart(sample_frame, chart_type='scatter_analysis')
+        
+        assert all(trace.type == 'scattergl' for trace in fig.data)
+        assert len(fig.data[0].marker.size) == (sample_frame['platform'] == fig.data[0].name).sum()
+    
+    @pytest.mark.parametrize("data", [[], pd.DataFrame(), ["not a product"]])
+    def test_create_chart_invalid_data(self, data):
+        """Test empty or malformed input is rejected."""
+        visualizer = PriceVisualizer()
+        
+        with pytest.raises(ValueError):
+            visualizer.create_chart(data)
+        with pytest.raises(ValueError):
+            visualizer.create_dashboard(data)
+
+
+class TestBaseVisualizer:
+    """Test BaseVisualizer module behavior."""
+    
+    def test_import_does_not_load_plotly(self):
+        """Test importing base_visualizer leaves plotly and seaborn unimported."""
+        code = (
+            "import sys\n"
+            "import ecommerce_price_monitor.visualizers.base_visualizer\n"
+            "print(sorted(m for m in ('plotly', 'seaborn') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        
+        assert result.stdout.strip() == '[]'
+    
+    def test_image_export_starts_kaleido_server_once(self, sample_frame, monkeypatch):
+        """Test image saves start Kaleido's persistent server once and reuse it."""
+        start = MagicMock()
+        monkeypatch.setitem(sys.modules, 'kaleido', SimpleNamespace(start_sync_server=start))
+        base_visualizer._start_kaleido_server.cache_clear()
+        visualizer = PriceVisualizer()
+        fig = visualizer.create_chart(sample_frame)
+        
+        try:
+            with patch.object(type(fig), 'write_image') as write_image:
+                visualizer.save_chart(fig, 'first', 'png', None)
+                visualizer.save_chart(fig, 'second', 'png', None)
+        finally:
+            base_visualizer._start_kaleido_server.cache_clear()
+        
+        start.assert_called_once_with(silence_warnings=True)
+        assert write_image.call_count == 2
+
+
+class TestDownsampleIndices:
+    """Test trend series decimation."""
+    
+    @pytest.mark.parametrize("n, max_points", [(2996, 2000), (3000, 2000), (10, 5)])
+    def test_keeps_extremes_in_tail(self, n, max_points):
+        """Test decimation covers every point, including a length that does not divide evenly."""
+        values = np.zeros(n)
+        values[n - 4] = 100.0
+        values[n - 2] = -100.0
+        
+        indices = _downsample_indices(values, max_points)
+        
+        assert len(indices) <= max_points
+        assert indices[0] == 0 and indices[-1] == n - 1
+        assert {n - 4, n - 2} <= set(indices.tolist())